@@ -1,29 +1,35 @@
 """AST node definitions for Droe DSL compiler."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, List, Optional, Union
 
 
-@dataclass
+# Nodes are slotted where dataclasses support it (Python 3.10+), so they
+# carry no per-instance __dict__ and attribute reads are slot lookups
+_node = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+@_node
 class ASTNode:
     """Base class for all AST nodes."""
     line_number: Optional[int] = field(default=None, init=False)
 
 
-@dataclass
+@_node
 class Literal(ASTNode):
     """Represents a literal value (string, number, boolean)."""
     value: Union[str, int, float, bool]
     type: str  # 'string', 'number', 'boolean'
 
 
-@dataclass
+@_node
 class Identifier(ASTNode):
     """Represents an identifier (variable name)."""
     name: str
 
 
-@dataclass
+@_node
 class BinaryOp(ASTNode):
     """Represents a binary operation (e.g., >, <, ==, +, -)."""
     left: ASTNode
@@ -31,13 +37,13 @@ class BinaryOp(ASTNode):
     right: ASTNode
 
 
-@dataclass
+@_node
 class DisplayStatement(ASTNode):
     """Represents a display statement."""
     expression: ASTNode
 
 
-@dataclass
+@_node
 class IfStatement(ASTNode):
     """Represents an if-then statement."""
     condition: ASTNode
@@ -45,34 +51,34 @@ class IfStatement(ASTNode):
     else_body: Optional[List[ASTNode]] = None
 
 
-@dataclass
+@_node
 class PropertyAccess(ASTNode):
     """Represents property access (e.g., user.age)."""
     object: ASTNode
     property: str
 
 
-@dataclass
+@_node
 class Assignment(ASTNode):
     """Represents a variable assignment (set x to value)."""
     variable: str
     value: ASTNode
 
 
-@dataclass
+@_node
 class ArrayLiteral(ASTNode):
     """Represents an array literal like ["a", "b", "c"]."""
     elements: List[ASTNode]
 
 
-@dataclass
+@_node
 class WhileLoop(ASTNode):
     """Represents a while loop."""
     condition: ASTNode
     body: List[ASTNode]
 
 
-@dataclass
+@_node
 class ForEachLoop(ASTNode):
     """Represents a for each loop."""
     variable: str
@@ -80,7 +86,7 @@ class ForEachLoop(ASTNode):
     body: List[ASTNode]
 
 
-@dataclass
+@_node
 class ArithmeticOp(ASTNode):
     """Represents arithmetic operations (+, -, *, /)."""
     left: ASTNode
@@ -88,7 +94,7 @@ class ArithmeticOp(ASTNode):
     right: ASTNode
 
 
-@dataclass
+@_node
 class TaskAction(ASTNode):
     """Represents a task action definition (task name with params ... end)."""
     name: str
@@ -96,41 +102,41 @@ class TaskAction(ASTNode):
     body: List[ASTNode] = field(default_factory=list)
 
 
-@dataclass
+@_node
 class TaskInvocation(ASTNode):
     """Represents a task invocation (run task_name with args)."""
     task_name: str
     arguments: List[ASTNode] = field(default_factory=list)  # Arguments for parameterized tasks
 
 
-@dataclass
+@_node
 class ActionDefinition(ASTNode):
     """Represents an action definition (action name ... end action)."""
     name: str
     body: List[ASTNode]
 
 
-@dataclass
+@_node
 class ReturnStatement(ASTNode):
     """Represents a return statement (respond with, answer is, output, give)."""
     expression: ASTNode
     return_type: str  # 'respond_with', 'answer_is', 'output', 'give'
 
 
-@dataclass
+@_node
 class ActionInvocation(ASTNode):
     """Represents an action invocation that returns a value."""
     action_name: str
 
 
-@dataclass
+@_node
 class ModuleDefinition(ASTNode):
     """Represents a module definition (module name ... end module)."""
     name: str
     body: List[ASTNode]
 
 
-@dataclass
+@_node
 class DataDefinition(ASTNode):
     """Represents a data structure definition (data Name ... end data)."""
     name: str
@@ -138,7 +144,7 @@ class DataDefinition(ASTNode):
     storage_type: Optional[str] = None  # 'short_store' (sessionStorage) or 'long_store' (localStorage)
 
 
-@dataclass
+@_node
 class DataField(ASTNode):
     """Represents a field in a data structure."""
     name: str
@@ -146,7 +152,7 @@ class DataField(ASTNode):
     annotations: List[str] = field(default_factory=list)  # e.g., ['required', 'unique', 'key', 'auto']
 
 
-@dataclass
+@_node
 class ActionDefinitionWithParams(ASTNode):
     """Represents an action definition with parameters and return type."""
     name: str
@@ -155,14 +161,14 @@ class ActionDefinitionWithParams(ASTNode):
     body: List[ASTNode]
 
 
-@dataclass
+@_node
 class ActionParameter(ASTNode):
     """Represents a parameter in an action definition."""
     name: str
     type: str
 
 
-@dataclass
+@_node
 class ActionInvocationWithArgs(ASTNode):
     """Represents an action invocation with arguments."""
     module_name: Optional[str]  # For module.action calls
@@ -170,55 +176,55 @@ class ActionInvocationWithArgs(ASTNode):
     arguments: List[ASTNode]
 
 
-@dataclass
+@_node
 class StringInterpolation(ASTNode):
     """Represents a string with variable interpolation like 'Hello [name]'."""
     parts: List[ASTNode]  # Mix of Literal (for text) and Identifier (for variables)
 
 
-@dataclass
+@_node
 class DataInstance(ASTNode):
     """Represents a data structure instance creation."""
     data_type: str  # The data type name (e.g., "User")
     field_values: List['FieldAssignment']  # Field assignments
 
 
-@dataclass
+@_node
 class FieldAssignment(ASTNode):
     """Represents a field assignment in data instance creation."""
     field_name: str
     value: ASTNode
 
 
-@dataclass
+@_node
 class IncludeStatement(ASTNode):
     """Represents an include statement (include ModuleName.droe)."""
     module_name: str  # The module name without .droe extension
     file_path: str    # The full file path (ModuleName.droe)
 
 
-@dataclass
+@_node
 class AssetInclude(ASTNode):
     """Represents an asset include statement (include assets/style.css)."""
     asset_path: str  # Path to asset file
     asset_type: str  # 'css', 'js', 'font', etc.
 
 
-@dataclass
+@_node
 class FormatExpression(ASTNode):
     """Represents a format expression (format variable as "pattern")."""
     expression: ASTNode  # The expression to format
     format_pattern: str  # The format pattern string
 
 
-@dataclass
+@_node
 class MetadataAnnotation(ASTNode):
     """Represents a metadata annotation like @target web or @metadata(platform="mobile")."""
     key: str  # The annotation key (target, name, description, metadata)
     value: Union[str, dict]  # The annotation value or parameters dict
 
 
-@dataclass
+@_node
 class FragmentDefinition(ASTNode):
     """Represents a fragment definition (fragment name ... end fragment)."""
     name: str
@@ -228,14 +234,14 @@ class FragmentDefinition(ASTNode):
     styles: Optional[str] = None  # Inline styles
 
 
-@dataclass
+@_node
 class FragmentReference(ASTNode):
     """Represents a reference to a fragment with slot content (fragment name ... end fragment)."""
     fragment_name: str
     slot_contents: dict = field(default_factory=dict)  # Map slot names to content lists
 
 
-@dataclass
+@_node
 class ScreenDefinition(ASTNode):
     """Represents a screen definition (screen name ... end screen)."""
     name: str
@@ -245,7 +251,7 @@ class ScreenDefinition(ASTNode):
     styles: Optional[str] = None  # Inline styles
 
 
-@dataclass
+@_node
 class SlotComponent(ASTNode):
     """Represents a slot component for fragments (slot "name")."""
     name: str  # Slot name like "content", "header", "footer", "sidebar"
@@ -256,7 +262,7 @@ class SlotComponent(ASTNode):
     component_type: str = field(default="slot", init=False)
 
 
-@dataclass
+@_node
 class FormDefinition(ASTNode):
     """Represents a form definition (form name ... end form)."""
     name: str
@@ -266,7 +272,7 @@ class FormDefinition(ASTNode):
     styles: Optional[str] = None  # Inline styles
 
 
-@dataclass
+@_node
 class TitleComponent(ASTNode):
     """Represents a title component."""
     text: str
@@ -276,7 +282,7 @@ class TitleComponent(ASTNode):
     component_type: str = field(default="title", init=False)
 
 
-@dataclass
+@_node
 class TextComponent(ASTNode):
     """Represents a text component for displaying text content."""
     text: str
@@ -286,7 +292,7 @@ class TextComponent(ASTNode):
     component_type: str = field(default="text", init=False)
 
 
-@dataclass
+@_node
 class InputComponent(ASTNode):
     """Represents an input component."""
     input_type: str = "text"  # 'text', 'password', 'email', etc.
@@ -298,7 +304,7 @@ class InputComponent(ASTNode):
     component_type: str = field(default="input", init=False)
 
 
-@dataclass
+@_node
 class TextareaComponent(ASTNode):
     """Represents a textarea component."""
     label: Optional[str] = None
@@ -312,7 +318,7 @@ class TextareaComponent(ASTNode):
     component_type: str = field(default="textarea", init=False)
 
 
-@dataclass
+@_node
 class DropdownComponent(ASTNode):
     """Represents a dropdown/select component."""
     label: Optional[str] = None
@@ -325,7 +331,7 @@ class DropdownComponent(ASTNode):
     component_type: str = field(default="dropdown", init=False)
 
 
-@dataclass
+@_node
 class ToggleComponent(ASTNode):
     """Represents a toggle/switch component."""
     binding: Optional[str] = None
@@ -336,7 +342,7 @@ class ToggleComponent(ASTNode):
     component_type: str = field(default="toggle", init=False)
 
 
-@dataclass
+@_node
 class CheckboxComponent(ASTNode):
     """Represents a checkbox component."""
     text: Optional[str] = None
@@ -348,7 +354,7 @@ class CheckboxComponent(ASTNode):
     component_type: str = field(default="checkbox", init=False)
 
 
-@dataclass
+@_node
 class RadioComponent(ASTNode):
     """Represents a radio button component."""
     text: Optional[str] = None
@@ -361,7 +367,7 @@ class RadioComponent(ASTNode):
     component_type: str = field(default="radio", init=False)
 
 
-@dataclass
+@_node
 class ButtonComponent(ASTNode):
     """Represents a button component."""
     text: str
@@ -372,7 +378,7 @@ class ButtonComponent(ASTNode):
     component_type: str = field(default="button", init=False)
 
 
-@dataclass
+@_node
 class ImageComponent(ASTNode):
     """Represents an image component."""
     src: str  # Image source path
@@ -383,7 +389,7 @@ class ImageComponent(ASTNode):
     component_type: str = field(default="image", init=False)
 
 
-@dataclass
+@_node
 class VideoComponent(ASTNode):
     """Represents a video component."""
     src: str  # Video source path
@@ -397,7 +403,7 @@ class VideoComponent(ASTNode):
     component_type: str = field(default="video", init=False)
 
 
-@dataclass
+@_node
 class AudioComponent(ASTNode):
     """Represents an audio component."""
     src: str  # Audio source path
@@ -410,35 +416,35 @@ class AudioComponent(ASTNode):
     component_type: str = field(default="audio", init=False)
 
 
-@dataclass
+@_node
 class AttributeDefinition(ASTNode):
     """Represents an attribute definition (validate required, bind LoginForm.email, etc.)."""
     name: str
     value: Optional[ASTNode] = None  # Can be a literal or expression
 
 
-@dataclass
+@_node
 class ValidationAttribute(ASTNode):
     """Represents a validation attribute."""
     validation_type: str  # 'required', 'email', 'numeric', etc.
     name: str = field(default="validate", init=False)
 
 
-@dataclass
+@_node
 class BindingAttribute(ASTNode):
     """Represents a data binding attribute."""
     binding_target: str  # e.g., 'LoginForm.email'
     name: str = field(default="bind", init=False)
 
 
-@dataclass
+@_node
 class ActionAttribute(ASTNode):
     """Represents an action attribute (run action_name)."""
     action_name: str
     name: str = field(default="run", init=False)
 
 
-@dataclass
+@_node
 class ApiCallStatement(ASTNode):
     """Represents an API call statement (call/fetch /endpoint method GET/POST with data)."""
     verb: str  # 'call', 'fetch', 'update', 'delete'
@@ -449,7 +455,7 @@ class ApiCallStatement(ASTNode):
     response_variable: Optional[str] = None  # Variable to store response (e.g., 'response')
     
     
-@dataclass
+@_node
 class ApiHeader(ASTNode):
     """Represents an API header (Authorization: "Bearer Token")."""
     name: str  # 'Authorization', 'Content-Type', etc.
@@ -458,7 +464,7 @@ class ApiHeader(ASTNode):
 
 
 
-@dataclass
+@_node
 class ServeStatement(ASTNode):
     """Represents a serve statement (serve get/post/put/delete /endpoint ... end serve)."""
     method: str  # 'get', 'post', 'put', 'delete'
@@ -468,27 +474,27 @@ class ServeStatement(ASTNode):
     accept_type: Optional[str] = None  # Type for request body (accept statement)
     response_action: Optional[ASTNode] = None  # Action called for response
 
-@dataclass
+@_node
 class AcceptStatement(ASTNode):
     """Represents an accept statement (accept TypeName.actionName)."""
     module_name: str
     action_name: str
     param_name: Optional[str] = None  # For accept ... with param_name
 
-@dataclass
+@_node
 class RespondStatement(ASTNode):
     """Represents a respond statement (respond with ModuleName.actionName)."""
     module_name: str
     action_name: str
     param_name: Optional[str] = None  # For respond with ... with param_name
 
-@dataclass
+@_node
 class ParamsStatement(ASTNode):
     """Represents a params statement (params id which is text)."""
     param_name: str
     param_type: str
 
-@dataclass
+@_node
 class DatabaseStatement(ASTNode):
     """Represents a database operation (db find/create/update User ...)."""
     operation: str  # 'find', 'create', 'update', 'delete'
@@ -497,7 +503,7 @@ class DatabaseStatement(ASTNode):
     fields: List[ASTNode] = field(default_factory=list)  # set clauses for update
     return_var: Optional[str] = None  # return id into variable
 
-@dataclass
+@_node
 class Program(ASTNode):
     """Root node containing all statements in the program."""
     statements: List[ASTNode]
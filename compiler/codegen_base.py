@@ -4,10 +4,11 @@ This module provides the abstract base class and common functionality
 for all target-specific code generators.
 """
 
+import io
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
-from .symbols import SymbolTable, VariableType
-from .ast import ASTNode, Program
+from .symbols import SymbolTable, VariableType, lookup_var_type
+from .ast import ASTNode, Program, Literal, Identifier, ActionInvocation, ActionInvocationWithArgs
 
 
 class CodeGenError(Exception):
@@ -15,12 +16,21 @@ class CodeGenError(Exception):
     pass
 
 
+# Indent strings for the nesting depths generated code reaches in practice
+_INDENTS = tuple('  ' * level for level in range(64))
+
+
 class BaseCodeGenerator(ABC):
     """Abstract base class for all code generators."""
     
+    # Subclasses that declare their own __slots__ get no per-instance __dict__
+    __slots__ = ('symbol_table', 'output', '_indent_level', '_indent', 'string_constants',
+                 'next_string_index', 'core_libs_enabled', 'available_libs')
+    
     def __init__(self):
         self.symbol_table = SymbolTable()
-        self.output: List[str] = []
+        # Lines are written to one growing buffer, each ending in a newline
+        self.output = io.StringIO()
         self.indent_level = 0
         self.string_constants: Dict[str, int] = {}
         self.next_string_index = 0
@@ -44,18 +54,41 @@ class BaseCodeGenerator(ABC):
         """Emit code for a statement."""
         pass
     
+    @property
+    def indent_level(self) -> int:
+        """Current nesting depth of emitted lines."""
+        return self._indent_level
+    
+    @indent_level.setter
+    def indent_level(self, level: int):
+        # The indent string is only rebuilt when the depth changes
+        self._indent_level = level
+        self._indent = _INDENTS[level] if 0 <= level < len(_INDENTS) else '  ' * level
+    
+    def indent(self):
+        """Increase the indentation of subsequently emitted lines."""
+        self.indent_level = self._indent_level + 1
+    
+    def dedent(self):
+        """Decrease the indentation of subsequently emitted lines."""
+        self.indent_level = self._indent_level - 1
+    
     def emit(self, code: str):
         """Emit a line of code with proper indentation."""
-        indent = '  ' * self.indent_level
-        self.output.append(f"{indent}{code}")
+        output = self.output
+        output.write(self._indent)
+        output.write(code)
+        output.write('\n')
     
     def get_output(self) -> str:
         """Get the generated code as a string."""
-        return '\n'.join(self.output)
+        # Drop the newline after the last line
+        return self.output.getvalue()[:-1]
     
     def clear_output(self):
         """Clear the output buffer."""
-        self.output.clear()
+        self.output.seek(0)
+        self.output.truncate()
     
     def add_string_constant(self, value: str) -> int:
         """Add a string constant and return its index."""
@@ -95,42 +128,22 @@ class BaseCodeGenerator(ABC):
     
     def map_user_type_to_internal(self, user_type: str) -> VariableType:
         """Map user-facing type names to internal VariableType enum."""
-        type_mapping = {
-            # Modern types
-            'int': VariableType.INT,
-            'decimal': VariableType.DECIMAL,
-            'text': VariableType.TEXT,
-            'flag': VariableType.FLAG,
-            'yesno': VariableType.YESNO,
-            'date': VariableType.DATE,
-            'list_of': VariableType.LIST_OF,
-            'group_of': VariableType.GROUP_OF,
-            'file': VariableType.FILE,
-            
-            # Legacy types
-            'number': VariableType.NUMBER,
-            'boolean': VariableType.BOOLEAN,
-            'string': VariableType.STRING,
-            'array': VariableType.ARRAY,
-        }
-        
         # Handle compound collection types like "list_of_int", "group_of_text"
         if user_type.startswith('list_of_'):
             return VariableType.LIST_OF
         elif user_type.startswith('group_of_'):
             return VariableType.GROUP_OF
         
-        if user_type not in type_mapping:
+        internal_type = lookup_var_type(user_type)
+        if internal_type is None:
             raise CodeGenError(f"Unknown type: {user_type}")
         
-        return type_mapping[user_type]
+        return internal_type
     
     def infer_type(self, node: ASTNode) -> VariableType:
         """Infer the type of an AST node."""
         # This will be implemented by subclasses with target-specific logic
         # Base implementation provides common type inference
-        from .ast import Literal, Identifier, ActionInvocation, ActionInvocationWithArgs
-        
         if isinstance(node, Literal):
             if isinstance(node.value, str):
                 return VariableType.TEXT
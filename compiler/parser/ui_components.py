@@ -1,7 +1,8 @@
 """UI components parsing - fixed to match AST definitions."""
 
 import re
-from typing import List, Optional, Dict, Any
+import sys
+from typing import Iterator, List, Optional
 from ..ast import (
     ASTNode, TitleComponent, InputComponent, TextareaComponent, 
     DropdownComponent, ToggleComponent, CheckboxComponent, RadioComponent,
@@ -12,6 +13,25 @@ from ..ast import (
 from .base import BaseParser, ParseError
 
 
+# Matches any attribute keyword the component handlers look for. Lines without
+# a match carry no attributes, so the handlers can skip full tokenization.
+_HAS_ATTRS = re.compile(
+    r'(?:^|\s)(class|id|bind|action|type|default|placeholder|validate|rows|'
+    r'options|group|source|alt|controls|autoplay|loop|muted|classes|styles)\b'
+)
+
+# Characters that affect how bracket attribute text is split into parts
+_ATTR_SCAN = re.compile(r'''["'()\[\]{},]''')
+_ATTR_NESTING = re.compile(r'''["'()\[\]{}]''')
+
+# Attribute classes for 'prefix:value' parts in bracket notation
+_ATTR_PREFIX_MAP = {
+    'validate': ValidationAttribute,
+    'bind': BindingAttribute,
+    'action': ActionAttribute,
+}
+
+
 class UIComponentParser(BaseParser):
     """Parser for UI components that work across web and mobile - fixed version."""
     
@@ -25,33 +45,39 @@ class UIComponentParser(BaseParser):
         'contact': 'contact'
     }
     
+    def _iter_tokens(self, content: str) -> Iterator[str]:
+        """Yield the tokens of content in order, respecting quoted strings."""
+        start = 0
+        i = 0
+        length = len(content)
+        
+        # Slice tokens out of the content instead of growing them a character at
+        # a time; quoted sections are skipped in one jump to the closing quote.
+        while i < length:
+            char = content[i]
+            if char == ' ':
+                token = content[start:i].strip()
+                if token:
+                    yield token
+                start = i + 1
+            elif char == '"' or char == "'":
+                close = content.find(char, i + 1)
+                if close == -1:
+                    break
+                i = close
+            i += 1
+        
+        token = content[start:].strip()
+        if token:
+            yield token
+    
     def _parse_tokens(self, content: str) -> List[str]:
         """Parse content into tokens, respecting quoted strings."""
-        tokens = []
-        current = ""
-        in_quotes = False
-        quote_char = None
-        
-        for char in content:
-            if not in_quotes and (char == '"' or char == "'"):
-                in_quotes = True
-                quote_char = char
-                current += char
-            elif in_quotes and char == quote_char:
-                in_quotes = False
-                quote_char = None
-                current += char
-            elif not in_quotes and char == ' ':
-                if current.strip():
-                    tokens.append(current.strip())
-                current = ""
-            else:
-                current += char
-        
-        if current.strip():
-            tokens.append(current.strip())
-        
-        return tokens
+        return list(self._iter_tokens(content))
+    
+    def _lead_token(self, content: str) -> Optional[str]:
+        """Return the first token _parse_tokens would produce, scanning only that far."""
+        return next(self._iter_tokens(content), None)
     
     def _unquote(self, text: str) -> str:
         """Remove quotes from a string if present."""
@@ -217,6 +243,11 @@ class UIComponentParser(BaseParser):
         element_id = None
         placeholder = None
         
+        # Fast path: no attribute keywords, nothing to tokenize
+        if not _HAS_ATTRS.search(content):
+            return InputComponent(input_type=input_type, binding=binding,
+                                  attributes=attributes, element_id=element_id)
+        
         # Split content into tokens while respecting quotes
         tokens = self._parse_tokens(content)
         
@@ -270,6 +301,15 @@ class UIComponentParser(BaseParser):
         label = None
         rows = None
         
+        # Fast path: no attribute keywords, only the label can be present
+        if not _HAS_ATTRS.search(content):
+            lead = self._lead_token(content)
+            if lead and (lead.startswith('"') or lead.startswith("'")):
+                label = self._unquote(lead)
+            return TextareaComponent(label=label, placeholder=placeholder, rows=4,
+                                     binding=binding, attributes=attributes,
+                                     element_id=element_id)
+        
         # Parse tokens
         tokens = self._parse_tokens(content)
         
@@ -331,6 +371,14 @@ class UIComponentParser(BaseParser):
         element_id = None
         label = None
         
+        # Fast path: no attribute keywords, only the label can be present
+        if not _HAS_ATTRS.search(content):
+            lead = self._lead_token(content)
+            if lead and (lead.startswith('"') or lead.startswith("'")):
+                label = self._unquote(lead)
+            return DropdownComponent(label=label, options=options, binding=binding,
+                                     attributes=attributes, element_id=element_id)
+        
         # Parse tokens
         tokens = self._parse_tokens(content)
         
@@ -536,6 +584,13 @@ class UIComponentParser(BaseParser):
         action = None
         attributes = []
         
+        # Fast path: no attribute keywords, only the button text can be present
+        if not _HAS_ATTRS.search(content):
+            lead = self._lead_token(content)
+            if lead:
+                text = self._unquote(lead) if lead.startswith('"') or lead.startswith("'") else lead
+            return ButtonComponent(text=text, action=action, attributes=attributes)
+        
         # Parse the button text (first quoted string or first token)
         tokens = self._parse_tokens(content)
         
@@ -583,6 +638,10 @@ class UIComponentParser(BaseParser):
         alt = None
         attributes = []
         
+        # Fast path: no attribute keywords, nothing to tokenize
+        if not _HAS_ATTRS.search(content):
+            return ImageComponent(src=src, alt=alt, attributes=attributes)
+        
         # Parse tokens
         tokens = self._parse_tokens(content)
         
@@ -620,6 +679,11 @@ class UIComponentParser(BaseParser):
         muted = False
         attributes = []
         
+        # Fast path: no attribute keywords, nothing to tokenize
+        if not _HAS_ATTRS.search(content):
+            return VideoComponent(src=src, controls=controls, autoplay=autoplay,
+                                  loop=loop, muted=muted, attributes=attributes)
+        
         # Parse tokens
         tokens = self._parse_tokens(content)
         
@@ -676,6 +740,11 @@ class UIComponentParser(BaseParser):
         loop = False
         attributes = []
         
+        # Fast path: no attribute keywords, nothing to tokenize
+        if not _HAS_ATTRS.search(content):
+            return AudioComponent(src=src, controls=controls, autoplay=autoplay,
+                                  loop=loop, attributes=attributes)
+        
         # Parse tokens
         tokens = self._parse_tokens(content)
         
@@ -726,6 +795,13 @@ class UIComponentParser(BaseParser):
         attributes = []
         css_classes = []
         
+        # Fast path: no attribute keywords, only the slot name can be present
+        if not _HAS_ATTRS.search(content):
+            lead = self._lead_token(content)
+            if lead:
+                slot_name = self._unquote(lead)
+            return SlotComponent(name=slot_name, attributes=attributes, css_classes=css_classes)
+        
         # Parse tokens
         tokens = self._parse_tokens(content)
         
@@ -784,65 +860,64 @@ class UIComponentParser(BaseParser):
         """Parse component attributes from bracket notation."""
         attributes = []
         
-        # Split by comma, but respect nested structures
-        parts = []
-        current = ""
-        depth = 0
-        in_string = False
-        string_char = None
-        
-        for char in attr_text:
-            if not in_string and (char == '"' or char == "'"):
-                in_string = True
-                string_char = char
-            elif in_string and char == string_char:
-                in_string = False
-                string_char = None
-            elif not in_string:
-                if char in '([{':
+        if not _ATTR_NESTING.search(attr_text):
+            # No quotes or brackets, so every comma separates two parts
+            parts = [part.strip() for part in attr_text.split(',')]
+            if not parts[-1]:
+                parts.pop()
+        else:
+            # Split by comma, but respect nested structures. Only quotes, brackets
+            # and commas matter, so jump between them instead of walking every char.
+            parts = []
+            start = 0
+            depth = 0
+            string_char = None
+            
+            for match in _ATTR_SCAN.finditer(attr_text):
+                char = match.group()
+                if string_char is not None:
+                    if char == string_char:
+                        string_char = None
+                elif char == '"' or char == "'":
+                    string_char = char
+                elif char in '([{':
                     depth += 1
                 elif char in ')]}':
                     depth -= 1
-                elif char == ',' and depth == 0:
-                    parts.append(current.strip())
-                    current = ""
-                    continue
+                elif depth == 0:
+                    parts.append(attr_text[start:match.start()].strip())
+                    start = match.end()
             
-            current += char
-        
-        if current.strip():
-            parts.append(current.strip())
+            last = attr_text[start:].strip()
+            if last:
+                parts.append(last)
         
         # Parse each attribute
         for part in parts:
             part = part.strip()
             
-            # Validation attributes
-            if part.startswith('validate:'):
-                validate_content = part[9:].strip()
-                attributes.append(ValidationAttribute(validate_content))
-            
-            # Binding attributes
-            elif part.startswith('bind:'):
-                bind_target = part[5:].strip()
-                attributes.append(BindingAttribute(bind_target))
-            
-            # Action attributes
-            elif part.startswith('action:'):
-                action_content = part[7:].strip()
-                attributes.append(ActionAttribute(action_content))
+            # Validation, binding and action attributes ('prefix:value')
+            if ':' in part:
+                prefix, _, rest = part.partition(':')
+                attr_class = _ATTR_PREFIX_MAP.get(prefix)
+                if attr_class is not None:
+                    attributes.append(attr_class(rest.strip()))
+                    continue
             
             # Regular key=value attributes
-            elif '=' in part:
+            if '=' in part:
                 key, value = part.split('=', 1)
-                key = key.strip()
+                key = sys.intern(key.strip())
                 value = value.strip()
                 # Remove quotes from value if present
                 value = self.extract_string_literal(value) or value
+                # Short values such as 'text' or 'email' repeat across components
+                if len(value) < 32:
+                    value = sys.intern(value)
                 attributes.append(AttributeDefinition(key, value))
             
             # Simple flag attributes
             else:
-                attributes.append(AttributeDefinition(part, 'true'))
+                attributes.append(AttributeDefinition(sys.intern(part), 'true'))
         
         return attributes
\ No newline at end of file
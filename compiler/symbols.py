@@ -1,6 +1,7 @@
 """Symbol table for variable management in Droe DSL."""
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from enum import Enum
 
 
@@ -32,9 +33,20 @@ class VariableType(Enum):
     FILE = "file"
 
 
+# Plain dict from type name to member, avoiding the EnumMeta call path
+_VAR_TYPE_BY_NAME: Dict[str, VariableType] = {vt.value: vt for vt in VariableType}
+
+
+def lookup_var_type(name: str) -> Optional[VariableType]:
+    """Look up a VariableType by its value, or None if the name is unknown."""
+    return _VAR_TYPE_BY_NAME.get(name)
+
+
 class Variable:
     """Represents a variable in the symbol table."""
     
+    __slots__ = ('name', 'type', 'value', 'wasm_index')
+    
     def __init__(self, name: str, var_type: VariableType, value: Any = None, wasm_index: int = -1):
         self.name = name
         self.type = var_type
@@ -71,9 +83,9 @@ class SymbolTable:
         """Check if variable exists."""
         return name in self.variables
     
-    def get_all_variables(self) -> Dict[str, Variable]:
-        """Get all variables."""
-        return self.variables.copy()
+    def get_all_variables(self) -> Mapping[str, Variable]:
+        """Get a read-only view of all variables."""
+        return MappingProxyType(self.variables)
     
     def get_local_count(self) -> int:
         """Get the number of local variables needed."""
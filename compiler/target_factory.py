@@ -4,13 +4,37 @@ This module provides a factory system for creating target-specific
 code generators and managing compilation targets.
 """
 
-from typing import Dict, Type, Optional, List, Any
+import importlib
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Dict, Optional, Tuple, Any, Mapping
 from abc import ABC, abstractmethod
 from pathlib import Path
 from .codegen_base import BaseCodeGenerator
 from .ast import Program
 
 
+# Code generator classes resolved on first use, keyed by target name
+_CODEGEN_CLASSES: Dict[str, type] = {}
+
+
+def _load(name: str, module_path: str, cls_name: str) -> type:
+    """Import a target's code generator class once and cache it."""
+    cls = _CODEGEN_CLASSES.get(name)
+    if cls is None:
+        module = importlib.import_module(module_path, __package__)
+        cls = _CODEGEN_CLASSES[name] = getattr(module, cls_name)
+    return cls
+
+
+# Project root (directory holding droeconfig.json) found for each resolved
+# source directory, or None if the search found none
+_PROJECT_ROOT_CACHE: Dict[str, Optional[str]] = {}
+# Cache lookup default for a source directory that has not been searched yet
+_NOT_SEARCHED = object()
+
+
 class CompilerTarget(ABC):
     """Abstract base class for compilation targets."""
     
@@ -25,82 +49,82 @@ class CompilerTarget(ABC):
         pass
     
     @abstractmethod
-    def get_runtime_files(self) -> List[str]:
-        """Get list of runtime files needed for this target."""
+    def get_runtime_files(self) -> Tuple[str, ...]:
+        """Get the runtime files needed for this target."""
         pass
     
     @abstractmethod
-    def get_dependencies(self) -> List[str]:
-        """Get list of external dependencies for this target."""
+    def get_dependencies(self) -> Tuple[str, ...]:
+        """Get the external dependencies for this target."""
         pass
 
 
-class WASMTarget(CompilerTarget):
-    """WebAssembly compilation target."""
-    
-    def __init__(self):
-        super().__init__("wasm", ".wasm", "WebAssembly binary format")
-    
-    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain") -> BaseCodeGenerator:
-        from .targets.wasm.codegen import WATCodeGenerator
-        return WATCodeGenerator()
-    
-    def get_runtime_files(self) -> List[str]:
-        return ["run.js"]
-    
-    def get_dependencies(self) -> List[str]:
-        return ["node", "wat2wasm"]
-
-
-class PythonTarget(CompilerTarget):
-    """Python compilation target."""
-    
-    def __init__(self):
-        super().__init__("python", ".py", "Python source code")
-    
-    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain", package: Optional[str] = None, database: Optional[Dict[str, Any]] = None) -> BaseCodeGenerator:
-        from .targets.python.codegen import PythonCodeGenerator
-        return PythonCodeGenerator(source_file_path, is_main_file, framework, package, database)
-    
-    def get_runtime_files(self) -> List[str]:
-        return []  # No runtime files needed - using inline code generation
-    
-    def get_dependencies(self) -> List[str]:
-        return ["python3"]
-
-
-class JavaTarget(CompilerTarget):
-    """Java compilation target."""
-    
-    def __init__(self):
-        super().__init__("java", ".java", "Java source code")
-    
-    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain", package: Optional[str] = None, database: Optional[Dict[str, Any]] = None) -> BaseCodeGenerator:
-        from .targets.java.codegen import JavaCodeGenerator
-        return JavaCodeGenerator(source_file_path, is_main_file, framework, package, database)
-    
-    def get_runtime_files(self) -> List[str]:
-        return []  # No runtime files needed - using inline code generation
-    
-    def get_dependencies(self) -> List[str]:
-        return ["javac", "java"]
+@dataclass(frozen=True)
+class TargetSpec:
+    """Static description of a target whose codegen needs no special setup."""
+    name: str
+    file_extension: str
+    description: str
+    codegen_module: str
+    codegen_class: str
+    runtime_files: Tuple[str, ...] = ()
+    dependencies: Tuple[str, ...] = ()
+    # Codegen takes (source_file_path, is_main_file, framework, package, database)
+    project_args: bool = False
 
 
-class HTMLTarget(CompilerTarget):
-    """HTML/JavaScript compilation target."""
+class GenericTarget(CompilerTarget):
+    """Compilation target driven entirely by a TargetSpec."""
     
-    def __init__(self):
-        super().__init__("html", ".html", "HTML with embedded JavaScript")
-    
-    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain") -> BaseCodeGenerator:
-        from .targets.html.codegen import HTMLCodeGenerator
-        return HTMLCodeGenerator()
+    def __init__(self, spec: TargetSpec):
+        super().__init__(spec.name, spec.file_extension, spec.description)
+        self.spec = spec
     
-    def get_runtime_files(self) -> List[str]:
-        return ["roelang.js", "styles.css"]
-    
-    def get_dependencies(self) -> List[str]:
-        return []  # Runs in browser, no external deps
+    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, 
+                      framework: str = "plain", package: Optional[str] = None, 
+                      database: Optional[Dict[str, Any]] = None) -> BaseCodeGenerator:
+        spec = self.spec
+        codegen_class = _load(spec.name, spec.codegen_module, spec.codegen_class)
+        if spec.project_args:
+            return codegen_class(source_file_path, is_main_file, framework, package, database)
+        return codegen_class()
+    
+    def get_runtime_files(self) -> Tuple[str, ...]:
+        return self.spec.runtime_files
+    
+    def get_dependencies(self) -> Tuple[str, ...]:
+        return self.spec.dependencies
+
+
+_GENERIC_TARGETS: Tuple[TargetSpec, ...] = (
+    TargetSpec("wasm", ".wasm", "WebAssembly binary format",
+               ".targets.wasm.codegen", "WATCodeGenerator",
+               runtime_files=("run.js",), dependencies=("node", "wat2wasm")),
+    # No runtime files needed - using inline code generation
+    TargetSpec("python", ".py", "Python source code",
+               ".targets.python.codegen", "PythonCodeGenerator",
+               dependencies=("python3",), project_args=True),
+    TargetSpec("java", ".java", "Java source code",
+               ".targets.java.codegen", "JavaCodeGenerator",
+               dependencies=("javac", "java"), project_args=True),
+    # Runs in browser, no external deps
+    TargetSpec("html", ".html", "HTML with embedded JavaScript",
+               ".targets.html.codegen", "HTMLCodeGenerator",
+               runtime_files=("roelang.js", "styles.css")),
+    TargetSpec("node", ".js", "Node.js JavaScript code",
+               ".targets.node.codegen", "NodeCodeGenerator",
+               dependencies=("node", "npm"), project_args=True),
+    # VM is bundled separately
+    TargetSpec("bytecode", ".droebc", "Droe VM bytecode format",
+               ".targets.bytecode.codegen", "BytecodeGenerator",
+               dependencies=("droevm",)),
+    TargetSpec("droe", ".droebc", "Native DroeVM bytecode",
+               ".targets.bytecode.codegen", "BytecodeGenerator",
+               dependencies=("droevm",)),
+    # Puck JSON is consumed by the editor directly
+    TargetSpec("puck", ".puck.json", "Puck visual editor JSON format",
+               ".targets.puck.codegen", "PuckCodeGenerator"),
+)
 
 
 # Note: Kotlin and Swift targets have been replaced by the mobile target
@@ -111,96 +135,77 @@ class HTMLTarget(CompilerTarget):
 class GoTarget(CompilerTarget):
     """Go compilation target."""
     
+    _RUNTIME_FILES = ()  # No runtime files needed - using inline code generation
+    _DEPENDENCIES = ("go",)
+    
     def __init__(self):
         super().__init__("go", ".go", "Go source code")
     
     def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain", package: str = None, database_config: Dict = None) -> BaseCodeGenerator:
-        from .targets.go.codegen import GoCodeGenerator
+        GoCodeGenerator = _load("go", ".targets.go.codegen", "GoCodeGenerator")
         return GoCodeGenerator(framework=framework, database_config=database_config, package=package)
     
-    def get_runtime_files(self) -> List[str]:
-        return []  # No runtime files needed - using inline code generation
-    
-    def get_dependencies(self) -> List[str]:
-        return ["go"]
-
-
-class NodeTarget(CompilerTarget):
-    """Node.js compilation target."""
-    
-    def __init__(self):
-        super().__init__("node", ".js", "Node.js JavaScript code")
-    
-    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain", package: Optional[str] = None, database: Optional[Dict[str, Any]] = None) -> BaseCodeGenerator:
-        from .targets.node.codegen import NodeCodeGenerator
-        return NodeCodeGenerator(source_file_path, is_main_file, framework, package, database)
-    
-    def get_runtime_files(self) -> List[str]:
-        return []  # No runtime files needed - using inline code generation
+    def get_runtime_files(self) -> Tuple[str, ...]:
+        return self._RUNTIME_FILES
     
-    def get_dependencies(self) -> List[str]:
-        return ["node", "npm"]
-
-
-class BytecodeTarget(CompilerTarget):
-    """Bytecode compilation target for Droe VM."""
-    
-    def __init__(self):
-        super().__init__("bytecode", ".droebc", "Droe VM bytecode format")
-    
-    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain") -> BaseCodeGenerator:
-        from .targets.bytecode.codegen import BytecodeGenerator
-        return BytecodeGenerator()
-    
-    def get_runtime_files(self) -> List[str]:
-        return []  # VM is bundled separately
-    
-    def get_dependencies(self) -> List[str]:
-        return ["droevm"]  # Requires the Droe VM
+    def get_dependencies(self) -> Tuple[str, ...]:
+        return self._DEPENDENCIES
 
 
 class MobileTarget(CompilerTarget):
     """Mobile compilation target - generates Android and iOS projects."""
     
+    _RUNTIME_FILES = ()  # Mobile projects are complete standalone projects
+    _DEPENDENCIES = ("android-sdk", "xcode")  # Development environment dependencies
+    
     def __init__(self):
         super().__init__("mobile", ".mobile", "Mobile platforms (Android + iOS)")
     
     def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain") -> BaseCodeGenerator:
         # Mobile target generates complete project structures
-        from .targets.mobile.codegen import MobileProjectCodegen
+        MobileProjectCodegen = _load("mobile", ".targets.mobile.codegen", "MobileProjectCodegen")
         
         # Find project root by looking for droeconfig.json
         project_root = None
         if source_file_path:
-            current_dir = Path(source_file_path).parent
-            for _ in range(10):  # Search up to 10 levels
-                if (current_dir / "droeconfig.json").exists():
-                    project_root = str(current_dir)
-                    break
-                parent = current_dir.parent
-                if parent == current_dir:
-                    break
-                current_dir = parent
+            source_dir = Path(source_file_path).parent.resolve()
+            cache_key = str(source_dir)
+            project_root = _PROJECT_ROOT_CACHE.get(cache_key, _NOT_SEARCHED)
+            if project_root is _NOT_SEARCHED:
+                project_root = None
+                current_dir = source_dir
+                for _ in range(10):  # Search up to 10 levels
+                    if (current_dir / "droeconfig.json").exists():
+                        project_root = str(current_dir)
+                        break
+                    parent = current_dir.parent
+                    if parent == current_dir:
+                        break
+                    current_dir = parent
+                _PROJECT_ROOT_CACHE[cache_key] = project_root
         
         return MobileProjectCodegen(source_file_path, project_root)
     
-    def get_runtime_files(self) -> List[str]:
-        return []  # Mobile projects are complete standalone projects
+    def get_runtime_files(self) -> Tuple[str, ...]:
+        return self._RUNTIME_FILES
     
-    def get_dependencies(self) -> List[str]:
-        return ["android-sdk", "xcode"]  # Development environment dependencies
+    def get_dependencies(self) -> Tuple[str, ...]:
+        return self._DEPENDENCIES
 
 
 class RustTarget(CompilerTarget):
     """Rust compilation target - generates standard Rust code with Axum and database support."""
     
+    _RUNTIME_FILES = ()  # Rust projects are standalone
+    _DEPENDENCIES = ("cargo", "rustc")  # Rust toolchain
+    
     def __init__(self):
         super().__init__("rust", ".rs", "Rust with Axum/database support")
     
     def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, 
                       framework: str = "axum", package: Optional[str] = None, 
                       database: Optional[Dict[str, Any]] = None) -> BaseCodeGenerator:
-        from .targets.rust.codegen import RustCodeGenerator
+        RustCodeGenerator = _load("rust", ".targets.rust.codegen", "RustCodeGenerator")
         
         # Load database config from droeconfig.json if available
         if source_file_path and not database:
@@ -230,72 +235,39 @@ class RustTarget(CompilerTarget):
         
         return {}
     
-    def get_runtime_files(self) -> List[str]:
-        return []  # Rust projects are standalone
-    
-    def get_dependencies(self) -> List[str]:
-        return ["cargo", "rustc"]  # Rust toolchain
-
-
-class DroeTarget(CompilerTarget):
-    """Native DroeVM compilation target - generates DroeVM bytecode."""
-    
-    def __init__(self):
-        super().__init__("droe", ".droebc", "Native DroeVM bytecode")
-    
-    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, 
-                      framework: str = "plain", package: Optional[str] = None, 
-                      database: Optional[Dict[str, Any]] = None) -> BaseCodeGenerator:
-        from .targets.bytecode.codegen import BytecodeGenerator
-        return BytecodeGenerator()
+    def get_runtime_files(self) -> Tuple[str, ...]:
+        return self._RUNTIME_FILES
     
-    def get_runtime_files(self) -> List[str]:
-        return []  # DroeVM handles bytecode execution
-    
-    def get_dependencies(self) -> List[str]:
-        return ["droevm"]  # Requires the DroeVM runtime
-
-
-class PuckTarget(CompilerTarget):
-    """Puck editor JSON compilation target - generates Puck editor format."""
-    
-    def __init__(self):
-        super().__init__("puck", ".puck.json", "Puck visual editor JSON format")
-    
-    def create_codegen(self, source_file_path: str = None, is_main_file: bool = False, 
-                      framework: str = "plain", package: Optional[str] = None, 
-                      database: Optional[Dict[str, Any]] = None) -> BaseCodeGenerator:
-        from .targets.puck.codegen import PuckCodeGenerator
-        return PuckCodeGenerator()
-    
-    def get_runtime_files(self) -> List[str]:
-        return []  # Puck JSON is consumed by the editor directly
-    
-    def get_dependencies(self) -> List[str]:
-        return []  # No external dependencies needed
+    def get_dependencies(self) -> Tuple[str, ...]:
+        return self._DEPENDENCIES
 
 
 class TargetFactory:
     """Factory for creating compilation targets."""
     
     def __init__(self):
-        self._targets: Dict[str, Type[CompilerTarget]] = {
-            "wasm": WASMTarget,
-            "python": PythonTarget,
-            "java": JavaTarget,
-            "html": HTMLTarget,
+        # Each entry builds a target instance: a CompilerTarget subclass or a spec-bound GenericTarget
+        self._targets: Dict[str, Callable[[], CompilerTarget]] = {
+            spec.name: partial(GenericTarget, spec) for spec in _GENERIC_TARGETS
+        }
+        self._targets.update({
             "go": GoTarget,
-            "node": NodeTarget,
-            "bytecode": BytecodeTarget,
             "mobile": MobileTarget,
             "rust": RustTarget,
-            "droe": DroeTarget,
-            "puck": PuckTarget
-        }
+        })
+        # Targets are stateless, so one instance per name is shared by all callers
+        self._instances: Dict[str, CompilerTarget] = {}
+        self._info: Dict[str, Mapping[str, Any]] = {}
+        self._refresh_available()
+    
+    def _refresh_available(self):
+        """Recompute the cached target names after the registry changes."""
+        self._available = tuple(self._targets)
+        self._available_str = ", ".join(self._available)
     
-    def get_available_targets(self) -> List[str]:
-        """Get list of available compilation targets."""
-        return list(self._targets.keys())
+    def get_available_targets(self) -> Tuple[str, ...]:
+        """Get the names of available compilation targets."""
+        return self._available
     
     def create_target(self, target_name: str) -> CompilerTarget:
         """Create a compilation target by name."""
@@ -308,25 +280,36 @@ class TargetFactory:
                     f"See MOBILE_MIGRATION.md for details."
                 )
             
-            available = ", ".join(self.get_available_targets())
-            raise ValueError(f"Unknown target '{target_name}'. Available: {available}")
+            raise ValueError(f"Unknown target '{target_name}'. Available: {self._available_str}")
         
-        return self._targets[target_name]()
+        target = self._instances.get(target_name)
+        if target is None:
+            target = self._instances[target_name] = self._targets[target_name]()
+        return target
     
-    def register_target(self, name: str, target_class: Type[CompilerTarget]):
+    def register_target(self, name: str, target_class: Callable[[], CompilerTarget]):
         """Register a new compilation target."""
         self._targets[name] = target_class
+        self._refresh_available()
+        self._instances.pop(name, None)
+        self._info.pop(name, None)
     
-    def get_target_info(self, target_name: str) -> Dict[str, any]:
-        """Get information about a compilation target."""
-        target = self.create_target(target_name)
-        return {
-            "name": target.name,
-            "file_extension": target.file_extension,
-            "description": target.description,
-            "runtime_files": target.get_runtime_files(),
-            "dependencies": target.get_dependencies()
-        }
+    def get_target_info(self, target_name: str) -> Mapping[str, Any]:
+        """Get information about a compilation target.
+        
+        The result is computed once per target and returned as a read-only mapping.
+        """
+        info = self._info.get(target_name)
+        if info is None:
+            target = self.create_target(target_name)
+            info = self._info[target_name] = MappingProxyType({
+                "name": target.name,
+                "file_extension": target.file_extension,
+                "description": target.description,
+                "runtime_files": target.get_runtime_files(),
+                "dependencies": target.get_dependencies()
+            })
+        return info
 
 
 # Global factory instance
@@ -414,7 +397,7 @@ def _create_project_files(project_result: Dict[str, Any], source_file_path: str
     return str(base_dir)
 
 
-def get_target_codegen(target_name: str, source_file_path: str = None, is_main_file: bool = False) -> BaseCodeGenerator:
+def get_target_codegen(target_name: str, source_file_path: str = None, is_main_file: bool = False, framework: str = "plain") -> BaseCodeGenerator:
     """Get a code generator for a specific target."""
     target = target_factory.create_target(target_name)
-    return target.create_codegen(source_file_path, is_main_file)
\ No newline at end of file
+    return target.create_codegen(source_file_path, is_main_file, framework)
\ No newline at end of file
@@ -2,26 +2,254 @@
 
 import struct
 import json
+import math
+import operator
 import time
-from typing import List, Dict, Any, Optional
+from functools import partial
+try:
+    import orjson  # Optional: much faster serializer, stdlib json is the fallback
+except ImportError:
+    orjson = None
+from typing import IO, Callable, List, Dict, Any, Optional, Tuple
+from ... import ast as droe_ast
 from ...ast import *
 from ...codegen_base import BaseCodeGenerator, CodeGenError
 
 
+# Push operand tags. A Push instruction carries (tag, raw value) rather than a
+# descriptive dict; the tag picks the Rust Value variant when serializing.
+_PUSH_STR, _PUSH_NUM, _PUSH_BOOL, _PUSH_NULL, _PUSH_ARRAY = 0, 1, 2, 3, 4
+
+
+def _push_operand(value: Any) -> Tuple[int, Any]:
+    """Describe a Python constant as a tagged Push operand."""
+    if isinstance(value, str):
+        return (_PUSH_STR, value)
+    elif isinstance(value, bool):
+        # Checked before numbers: bool is a subclass of int
+        return (_PUSH_BOOL, value)
+    elif isinstance(value, (int, float)):
+        return (_PUSH_NUM, float(value))
+    return (_PUSH_NULL, None)
+
+
+def _serialize_value(tag: int, value: Any) -> Any:
+    """Serialize a tagged Push operand into the Rust Value enum form."""
+    if tag == _PUSH_STR:
+        return {"String": value}
+    elif tag == _PUSH_NUM:
+        return {"Number": value}
+    elif tag == _PUSH_BOOL:
+        return {"Boolean": value}
+    elif tag == _PUSH_ARRAY:
+        return {"Array": [_serialize_value(t, v) for t, v in value]}
+    return "Null"
+
+
+def _serialize_push(op: str, args: tuple) -> Any:
+    return {"Push": _serialize_value(args[0], args[1])}
+
+
+def _serialize_single(op: str, args: tuple) -> Any:
+    return {op: args[0]}
+
+
+def _serialize_define_task(op: str, args: tuple) -> Any:
+    return {op: [args[0], args[1], args[2]]}
+
+
+def _serialize_run_task(op: str, args: tuple) -> Any:
+    return {op: [args[0], args[1]]}
+
+
+def _serialize_with_args(op: str, args: tuple) -> Any:
+    """Serialize an instruction that was emitted with arguments."""
+    entry = _SERIALIZERS.get(op)
+    if entry is not None and len(args) >= entry[0]:
+        return entry[1](op, args)
+    return op
+
+
+# Opcode -> (minimum argument count, serializer). Opcodes that are missing, or
+# emitted with fewer arguments, serialize as the bare opcode name.
+_SERIALIZERS: Dict[str, Tuple[int, Callable[[str, tuple], Any]]] = {
+    "Push": (2, _serialize_push),
+    "LoadVar": (1, _serialize_single),
+    "StoreVar": (1, _serialize_single),
+    "Jump": (1, _serialize_single),
+    "JumpIfFalse": (1, _serialize_single),
+    "JumpIfTrue": (1, _serialize_single),
+    "CreateArray": (1, _serialize_single),
+    "CreateObject": (1, _serialize_single),
+    "SetField": (1, _serialize_single),
+    "GetField": (1, _serialize_single),
+    "DefineTask": (3, _serialize_define_task),
+    "RunTask": (2, _serialize_run_task),
+    "DefineData": (1, _serialize_single),
+    "DefineEndpoint": (1, _serialize_single),
+    "DatabaseOp": (1, _serialize_single),
+}
+
+
+# Source operator -> VM opcode for binary operations
+_BINARY_OPCODES: Dict[str, str] = {
+    '>': 'Gt',
+    '<': 'Lt',
+    '>=': 'Gte',
+    '<=': 'Lte',
+    '==': 'Eq',
+    '!=': 'Neq',
+    '+': 'Add',
+    '-': 'Sub',
+    '*': 'Mul',
+    '/': 'Div',
+}
+
+
+# Encoder for the bytecode JSON. Both encoders write compact JSON, without
+# spaces after separators, and the file is assembled with the same separators
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _dumps = partial(json.dumps, separators=(',', ':'))
+
+# Bytecode file metadata; created_at is filled in for each generated file
+_METADATA_TEMPLATE: Dict[str, Any] = {
+    "source_file": None,
+    "created_at": 0,
+    "compiler_version": "0.1.0"
+}
+
+# Instructions serialized per write when streaming the bytecode file
+_WRITE_BATCH = 1024
+
+
+_FOLD_ARITHMETIC: Dict[str, Callable[[float, float], float]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+_FOLD_COMPARISON: Dict[str, Callable[[float, float], bool]] = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+
+def _fold_constant(op: str, left: Any, right: Any) -> Optional[Tuple[int, Any]]:
+    """Evaluate a binary operation on two literal values at compile time.
+    
+    Follows the VM: arithmetic and ordering take numbers only, equality
+    compares values of the same kind. Returns None when the operation has to
+    be left to the VM (other operand kinds, division by zero, a result that
+    is not a finite number).
+    """
+    left_tag, left = _push_operand(left)
+    right_tag, right = _push_operand(right)
+    if op == '==' or op == '!=':
+        if left_tag != right_tag or left_tag == _PUSH_NULL:
+            return None
+        return (_PUSH_BOOL, (left == right) == (op == '=='))
+    if left_tag != _PUSH_NUM or right_tag != _PUSH_NUM:
+        return None
+    compare = _FOLD_COMPARISON.get(op)
+    if compare is not None:
+        return (_PUSH_BOOL, compare(left, right))
+    arithmetic = _FOLD_ARITHMETIC.get(op)
+    if arithmetic is None or (op == '/' and right == 0.0):
+        return None
+    result = arithmetic(left, right)
+    if not math.isfinite(result):
+        return None
+    return (_PUSH_NUM, result)
+
+
+def _constant_condition(condition: ASTNode) -> Optional[bool]:
+    """Return the value of a condition known at compile time, else None.
+    
+    Only boolean results count: the VM rejects any other condition value, so
+    those are left for it to report at run time.
+    """
+    if type(condition) is Literal:
+        operand = _push_operand(condition.value)
+    elif (type(condition) is BinaryOp and type(condition.left) is Literal
+            and type(condition.right) is Literal):
+        operand = _fold_constant(condition.operator, condition.left.value, condition.right.value)
+    else:
+        return None
+    if operand is None or operand[0] != _PUSH_BOOL:
+        return None
+    return operand[1]
+
+
+def _snake_case(name: str) -> str:
+    """Convert a CamelCase node class name to the snake_case visitor suffix."""
+    result = []
+    for i, char in enumerate(name):
+        if char.isupper() and i > 0:
+            result.append('_')
+        result.append(char.lower())
+    return ''.join(result)
+
+
+def _missing_visitor(generator: 'BytecodeGenerator', node: ASTNode) -> Any:
+    """Cached in place of a visitor for node classes the generator cannot handle."""
+    raise CodeGenError(f"No visitor method for {node.__class__.__name__}")
+
+
 class BytecodeGenerator(BaseCodeGenerator):
     """Generates bytecode for the Droe VM."""
     
+    __slots__ = ('instructions', 'constants', 'labels', 'label_refs',
+                 '_label_counter', 'current_loop_end', 'task_definitions')
+    
+    # Visitor functions keyed by the snake_case node class name they handle
+    _visitors: Dict[str, Callable] = {}
+    # Visitor function for each AST node class, filled in on first visit
+    _dispatch_cache: Dict[type, Callable] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may override visitors, so they must not share the tables
+        cls._collect_visitors()
+    
+    @classmethod
+    def _collect_visitors(cls):
+        """Build the visitor tables for this class once, at class creation."""
+        cls._visitors = {
+            name[6:]: getattr(cls, name) for name in dir(cls) if name.startswith('visit_')
+        }
+        # The AST node classes are known up front, so their dispatch is
+        # resolved here; node classes defined elsewhere are resolved on first visit
+        cls._dispatch_cache = {
+            node_class: cls._visitors.get(_snake_case(node_class.__name__), _missing_visitor)
+            for node_class in vars(droe_ast).values()
+            if isinstance(node_class, type) and issubclass(node_class, ASTNode)
+        }
+    
     def __init__(self):
         super().__init__()
-        self.instructions = []
-        self.constants = []
-        self.labels = {}
-        self.label_refs = {}
-        self.current_loop_end = None
-        self.task_definitions = {}
-        
-    def generate(self, ast: Program) -> str:
-        """Generate bytecode from AST and return as string."""
+        # Each instruction is an (opcode, args) tuple
+        self.instructions: List[Tuple[str, tuple]] = []
+        self.constants: List[Any] = []
+        self.labels: Dict[str, int] = {}
+        self.label_refs: Dict[int, str] = {}
+        # Number of labels created; labels are only marked later, so their
+        # names cannot be taken from the size of self.labels
+        self._label_counter = 0
+        self.current_loop_end: Optional[str] = None
+        self.task_definitions: Dict[str, Dict[str, Any]] = {}
+        
+    def generate(self, ast: Program, out: Optional[IO[str]] = None) -> Optional[str]:
+        """Generate bytecode from AST.
+        
+        Returns the JSON bytecode as a string, or streams it into ``out`` and
+        returns None when an output stream is given.
+        """
         try:
             # Generate instructions
             self.visit_program(ast)
@@ -32,22 +260,16 @@ class BytecodeGenerator(BaseCodeGenerator):
             # Resolve label references
             self._resolve_labels()
             
-            # Create bytecode file structure
-            bytecode_file = {
-                "version": 1,
-                "metadata": {
-                    "source_file": None,
-                    "created_at": int(time.time()),
-                    "compiler_version": "0.1.0"
-                },
-                "constants": self.constants,
-                "instructions": self._serialize_instructions(),
-                "debug_info": None
-            }
+            metadata = {**_METADATA_TEMPLATE, "created_at": int(time.time())}
             
             # For now, use JSON serialization
             # We'll update the Rust VM to handle JSON
-            return json.dumps(bytecode_file)
+            if out is not None:
+                self._write_json(out.write, metadata)
+                return None
+            parts: List[str] = []
+            self._write_json(parts.append, metadata)
+            return "".join(parts)
             
         except Exception as e:
             raise CodeGenError(f"Bytecode generation failed: {str(e)}")
@@ -60,36 +282,32 @@ class BytecodeGenerator(BaseCodeGenerator):
         """Emit bytecode for a statement."""
         self.visit(stmt)
     
-    def visit(self, node: ASTNode):
+    def visit(self, node: ASTNode) -> Any:
         """Visit an AST node using the visitor pattern."""
-        method_name = f"visit_{node.__class__.__name__.lower()}"
-        if hasattr(self, method_name):
-            method = getattr(self, method_name)
-            return method(node)
-        else:
-            raise CodeGenError(f"No visitor method for {node.__class__.__name__}")
-    
-    def emit(self, opcode: str, *args):
+        visitor = self._dispatch_cache.get(type(node))
+        if visitor is None:
+            visitor = self._resolve_visitor(type(node))
+        return visitor(self, node)
+    
+    @classmethod
+    def _resolve_visitor(cls, node_class: type) -> Callable:
+        """Find and cache the visitor function for an AST node class."""
+        visitor = cls._visitors.get(_snake_case(node_class.__name__), _missing_visitor)
+        cls._dispatch_cache[node_class] = visitor
+        return visitor
+    
+    def emit(self, opcode: str, *args: Any):
         """Emit a bytecode instruction."""
-        instruction = {"op": opcode}
-        if args:
-            instruction["args"] = list(args)
-        self.instructions.append(instruction)
+        self.instructions.append((opcode, args))
         
-    def emit_value(self, value):
+    def emit_value(self, value: Any):
         """Emit a value push instruction."""
-        if isinstance(value, str):
-            self.emit("Push", {"type": "String", "value": value})
-        elif isinstance(value, (int, float)):
-            self.emit("Push", {"type": "Number", "value": float(value)})
-        elif isinstance(value, bool):
-            self.emit("Push", {"type": "Boolean", "value": value})
-        else:
-            self.emit("Push", {"type": "Null"})
+        self.instructions.append(("Push", _push_operand(value)))
     
     def create_label(self) -> str:
         """Create a new unique label."""
-        label = f"L{len(self.labels)}"
+        label = f"L{self._label_counter}"
+        self._label_counter += 1
         return label
         
     def mark_label(self, label: str):
@@ -106,109 +324,30 @@ class BytecodeGenerator(BaseCodeGenerator):
         for instruction_idx, label in self.label_refs.items():
             if label not in self.labels:
                 raise CodeGenError(f"Undefined label: {label}")
-            self.instructions[instruction_idx]["args"][0] = self.labels[label]
-    
-    def _serialize_instructions(self) -> List[Any]:
-        """Convert instructions to serializable format matching Rust enum."""
-        result = []
-        for inst in self.instructions:
-            op = inst["op"]
-            args = inst.get("args", [])
-            
-            # Convert to Rust-compatible format
-            if op == "Push" and args:
-                value = args[0]
-                if value["type"] == "String":
-                    result.append({"Push": {"String": value["value"]}})
-                elif value["type"] == "Number":
-                    result.append({"Push": {"Number": value["value"]}})
-                elif value["type"] == "Boolean":
-                    result.append({"Push": {"Boolean": value["value"]}})
-                else:
-                    result.append({"Push": "Null"})
-            elif op == "LoadVar" and args:
-                result.append({"LoadVar": args[0]})
-            elif op == "StoreVar" and args:
-                result.append({"StoreVar": args[0]})
-            elif op in ["Display", "Add", "Sub", "Mul", "Div", "Eq", "Neq", "Lt", "Gt", "Lte", "Gte", "Pop", "Dup", "Return", "Halt", "Nop"]:
-                result.append(op)
-            elif op == "Jump" and args:
-                result.append({"Jump": args[0]})
-            elif op == "JumpIfFalse" and args:
-                result.append({"JumpIfFalse": args[0]})
-            elif op == "JumpIfTrue" and args:
-                result.append({"JumpIfTrue": args[0]})
-            elif op == "CreateArray" and args:
-                result.append({"CreateArray": args[0]})
-            elif op == "DefineTask" and len(args) >= 3:
-                result.append({"DefineTask": [args[0], args[1], args[2]]})
-            elif op == "RunTask" and len(args) >= 2:
-                result.append({"RunTask": [args[0], args[1]]})
-            elif op == "DefineData" and args:
-                result.append({"DefineData": args[0]})
-            elif op == "DefineEndpoint" and args:
-                result.append({"DefineEndpoint": args[0]})
-            elif op == "DatabaseOp" and args:
-                result.append({"DatabaseOp": args[0]})
-            elif op == "EndHandler":
-                result.append("EndHandler")
-            else:
-                # Fallback for unknown instructions
-                result.append(op)
-        
-        return result
-    
-    def _convert_to_rust_format(self, bytecode_file: dict) -> dict:
-        """Convert bytecode to format matching Rust structures."""
-        instructions = []
-        
-        for inst in bytecode_file["instructions"]:
-            op = inst["op"]
-            args = inst.get("args", [])
-            
-            # Convert to Rust enum format
-            if op == "Push":
-                value = args[0]
-                if value["type"] == "String":
-                    instructions.append({"Push": {"String": value["value"]}})
-                elif value["type"] == "Number":
-                    instructions.append({"Push": {"Number": value["value"]}})
-                elif value["type"] == "Boolean":
-                    instructions.append({"Push": {"Boolean": value["value"]}})
-                else:
-                    instructions.append({"Push": "Null"})
-            elif op == "LoadVar":
-                instructions.append({"LoadVar": args[0]})
-            elif op == "StoreVar":
-                instructions.append({"StoreVar": args[0]})
-            elif op == "Display":
-                instructions.append("Display")
-            elif op == "Halt":
-                instructions.append("Halt")
-            elif op in ["Add", "Sub", "Mul", "Div", "Eq", "Neq", "Lt", "Gt", "Lte", "Gte"]:
-                instructions.append(op)
-            elif op == "Jump":
-                instructions.append({"Jump": args[0]})
-            elif op == "JumpIfFalse":
-                instructions.append({"JumpIfFalse": args[0]})
-            elif op == "JumpIfTrue":
-                instructions.append({"JumpIfTrue": args[0]})
-            elif op == "CreateArray":
-                instructions.append({"CreateArray": args[0]})
-            elif op == "DefineTask":
-                instructions.append({"DefineTask": [args[0], args[1], args[2]]})
-            elif op == "RunTask":
-                instructions.append({"RunTask": [args[0], args[1]]})
-            else:
-                instructions.append(op)
-        
-        return {
-            "version": bytecode_file["version"],
-            "metadata": bytecode_file["metadata"],
-            "constants": bytecode_file["constants"],
-            "instructions": instructions,
-            "debug_info": bytecode_file["debug_info"]
-        }
+            opcode, args = self.instructions[instruction_idx]
+            self.instructions[instruction_idx] = (opcode, (self.labels[label],) + args[1:])
+    
+    def _write_json(self, write: Callable[[str], Any], metadata: Dict[str, Any]):
+        """Write the bytecode file as JSON through ``write``, piece by piece.
+        
+        Instructions are serialized in batches of _WRITE_BATCH, so the list of
+        serialized instructions for the whole program is never held at once.
+        """
+        write(f'{{"version":1,"metadata":{_dumps(metadata)}'
+              f',"constants":{_dumps(self.constants)},"instructions":[')
+        instructions = self.instructions
+        for start in range(0, len(instructions), _WRITE_BATCH):
+            # Unit variants (Display, Add, Halt, ...) serialize as the bare
+            # opcode string itself
+            batch = [
+                _serialize_with_args(op, args) if args else op
+                for op, args in instructions[start:start + _WRITE_BATCH]
+            ]
+            if start:
+                write(',')
+            # Drop the brackets: the batch continues the enclosing array
+            write(_dumps(batch)[1:-1])
+        write('],"debug_info":null}')
     
     def visit_program(self, node: Program):
         """Visit program node."""
@@ -221,7 +360,7 @@ class BytecodeGenerator(BaseCodeGenerator):
         for stmt in node.statements:
             self.visit(stmt)
     
-    def visit_displaystatement(self, node: DisplayStatement):
+    def visit_display_statement(self, node: DisplayStatement):
         """Visit display statement."""
         self.visit(node.expression)
         self.emit("Display")
@@ -234,28 +373,39 @@ class BytecodeGenerator(BaseCodeGenerator):
         """Visit identifier."""
         self.emit("LoadVar", node.name)
     
-    def visit_binaryop(self, node: BinaryOp):
-        """Visit binary operation."""
-        self.visit(node.left)
-        self.visit(node.right)
-        
-        op_map = {
-            '>': 'Gt',
-            '<': 'Lt',
-            '>=': 'Gte',
-            '<=': 'Lte',
-            '==': 'Eq',
-            '!=': 'Neq',
-            '+': 'Add',
-            '-': 'Sub',
-            '*': 'Mul',
-            '/': 'Div',
-        }
-        
-        if node.operator in op_map:
-            self.emit(op_map[node.operator])
-        else:
-            raise CodeGenError(f"Unknown operator: {node.operator}")
+    def visit_binary_op(self, node: BinaryOp):
+        """Visit binary operation.
+        
+        Operator chains are walked with an explicit work stack instead of
+        recursing through visit(), so long expressions stay off the Python
+        call stack. Operands are emitted left to right, each operator after
+        both of its operands. An operation on two literals is folded into a
+        single Push when its result is known at compile time.
+        
+        Statement bodies (if, while, task) still recurse through visit(): their
+        depth follows the block nesting written in the source, while an
+        operator chain's depth grows with its length.
+        """
+        stack: List[Any] = [node]
+        while stack:
+            item = stack.pop()
+            if type(item) is str:
+                # Operator whose operands have been emitted
+                opcode = _BINARY_OPCODES.get(item)
+                if opcode is None:
+                    raise CodeGenError(f"Unknown operator: {item}")
+                self.emit(opcode)
+            elif type(item) is BinaryOp:
+                if type(item.left) is Literal and type(item.right) is Literal:
+                    folded = _fold_constant(item.operator, item.left.value, item.right.value)
+                    if folded is not None:
+                        self.instructions.append(("Push", folded))
+                        continue
+                stack.append(item.operator)
+                stack.append(item.right)
+                stack.append(item.left)
+            else:
+                self.visit(item)
     
     def visit_assignment(self, node: Assignment):
         """Visit assignment."""
@@ -263,7 +413,17 @@ class BytecodeGenerator(BaseCodeGenerator):
         self.emit("StoreVar", node.variable)
     
     def visit_if_statement(self, node: IfStatement):
-        """Visit if statement."""
+        """Visit if statement.
+        
+        When the condition is known at compile time only the branch that runs
+        is emitted, without the condition or jumps.
+        """
+        constant = _constant_condition(node.condition)
+        if constant is not None:
+            for stmt in (node.then_body if constant else node.else_body or ()):
+                self.visit(stmt)
+            return
+        
         else_label = self.create_label()
         end_label = self.create_label()
         
@@ -292,7 +452,13 @@ class BytecodeGenerator(BaseCodeGenerator):
         self.mark_label(end_label)
     
     def visit_while_loop(self, node: WhileLoop):
-        """Visit while loop."""
+        """Visit while loop.
+        
+        A loop whose condition is known to be false at compile time is left out.
+        """
+        if _constant_condition(node.condition) is False:
+            return
+        
         start_label = self.create_label()
         end_label = self.create_label()
         
@@ -330,6 +496,14 @@ class BytecodeGenerator(BaseCodeGenerator):
     
     def visit_array_literal(self, node: ArrayLiteral):
         """Visit array literal."""
+        # Arrays of constants are pushed as one ready-made array value
+        if all(type(element) is Literal for element in node.elements):
+            self.emit(
+                "Push", _PUSH_ARRAY,
+                [_push_operand(element.value) for element in node.elements]
+            )
+            return
+        
         # Push all elements
         for element in node.elements:
             self.visit(element)
@@ -339,33 +513,25 @@ class BytecodeGenerator(BaseCodeGenerator):
     
     def visit_task_action(self, node: TaskAction):
         """Visit task definition."""
-        end_label = self.create_label()
-        
         # Store task definition
         self.task_definitions[node.name] = {
             "params": [p.name for p in node.parameters],
             "start": len(self.instructions)
         }
         
-        # Emit task definition
+        # Emit task definition. This is not a label reference: the name is
+        # args[0], and only the end address is patched below.
         params = [p.name for p in node.parameters]
-        self.emit_jump("DefineTask", end_label)
-        self.instructions[-1]["args"] = [node.name, params, 0]  # Will fix end address
+        define_idx = len(self.instructions)
+        self.emit("DefineTask", node.name, params, 0)  # Will fix end address
         
         # Task body
         for stmt in node.body:
             self.visit(stmt)
         
-        # Mark end
-        self.mark_label(end_label)
-        
-        # Fix the task end address
-        for i, inst in enumerate(self.instructions):
-            if (inst["op"] == "DefineTask" and 
-                len(inst["args"]) > 0 and 
-                inst["args"][0] == node.name):
-                inst["args"][2] = self.labels[end_label]
-                break
+        # Fix the task end address. The VM resumes after body_end, so it is
+        # the last instruction of the body (the DefineTask itself if empty).
+        self.instructions[define_idx] = ("DefineTask", (node.name, params, len(self.instructions) - 1))
     
     def visit_task_invocation(self, node: TaskInvocation):
         """Visit task invocation."""
@@ -403,13 +569,22 @@ class BytecodeGenerator(BaseCodeGenerator):
     def visit_data_instance(self, node: DataInstance):
         """Visit data instance creation."""
         # Create object
-        self.emit("CreateObject", node.data_type)
+        pending = [("CreateObject", (node.data_type,))]
         
-        # Set fields
+        # Set fields. Instructions are collected locally and added in bulk;
+        # only non-constant values need a flush before visiting them.
         for field_assignment in node.field_values:
-            self.emit("Dup")  # Duplicate object reference
-            self.visit(field_assignment.value)
-            self.emit("SetField", field_assignment.field_name)
+            value = field_assignment.value
+            pending.append(("Dup", ()))  # Duplicate object reference
+            if type(value) is Literal:
+                pending.append(("Push", _push_operand(value.value)))
+            else:
+                self.instructions.extend(pending)
+                pending = []
+                self.visit(value)
+            pending.append(("SetField", (field_assignment.field_name,)))
+        
+        self.instructions.extend(pending)
     
     def visit_include_statement(self, node: IncludeStatement):
         """Visit include statement."""
@@ -417,7 +592,7 @@ class BytecodeGenerator(BaseCodeGenerator):
         # The included module's code is already part of the AST
         pass
     
-    def visit_moduledefinition(self, node: ModuleDefinition):
+    def visit_module_definition(self, node: ModuleDefinition):
         """Visit module definition."""
         # For now, just process the body
         # In a real implementation, we'd create module scope
@@ -442,7 +617,7 @@ class BytecodeGenerator(BaseCodeGenerator):
             body=node.body
         ))
     
-    def visit_datadefinition(self, node: DataDefinition):
+    def visit_data_definition(self, node: DataDefinition):
         """Visit data definition."""
         # Store data definition metadata for VM
         data_def = {
@@ -451,7 +626,7 @@ class BytecodeGenerator(BaseCodeGenerator):
         }
         self.emit("DefineData", data_def)
     
-    def visit_servestatement(self, node: ServeStatement):
+    def visit_serve_statement(self, node: ServeStatement):
         """Visit serve statement (HTTP endpoint definition)."""
         # Define HTTP endpoint
         endpoint_def = {
@@ -470,7 +645,7 @@ class BytecodeGenerator(BaseCodeGenerator):
         # End handler
         self.emit("EndHandler")
     
-    def visit_databasestatement(self, node: DatabaseStatement):
+    def visit_database_statement(self, node: DatabaseStatement):
         """Visit database statement."""
         operation = {
             "op": node.operation,
@@ -502,18 +677,22 @@ class BytecodeGenerator(BaseCodeGenerator):
             
         self.emit("DatabaseOp", operation)
     
-    def visit_metadataannotation(self, node: MetadataAnnotation):
+    def visit_metadata_annotation(self, node: MetadataAnnotation):
         """Visit metadata annotation."""
         # Metadata annotations are compile-time only
         # Store them for VM configuration if needed
         pass
 
 
-def generate(ast: Program, options: Optional[Dict[str, Any]] = None) -> str:
-    """Entry point for bytecode generation."""
-    generator = BytecodeGenerator()
-    bytecode_bytes = generator.generate(ast)
+BytecodeGenerator._collect_visitors()
+
+
+def generate(ast: Program, options: Optional[Dict[str, Any]] = None,
+             out: Optional[IO[str]] = None) -> Optional[str]:
+    """Entry point for bytecode generation.
     
-    # For file writing, we'll return the bytes as a string
-    # The file writer should handle this as binary
-    return bytecode_bytes.decode('utf-8')
\ No newline at end of file
+    Pass a text stream as ``out`` to write the bytecode file directly instead
+    of building the whole JSON string in memory.
+    """
+    generator = BytecodeGenerator()
+    return generator.generate(ast, out)
\ No newline at end of file
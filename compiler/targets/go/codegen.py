@@ -1,8 +1,10 @@
 """Go code generator for Roelang compiler."""
 
+import io
 import os
-from jinja2 import Environment, FileSystemLoader
-from typing import List, Dict, Any
+from collections.abc import Mapping
+from string import Template
+from typing import List, Dict, Any, Optional
 from ...ast import (
     ASTNode, Program, DisplayStatement, IfStatement,
     Literal, Identifier, BinaryOp, PropertyAccess,
@@ -16,27 +18,360 @@ from ...symbols import SymbolTable, VariableType
 from ...codegen_base import BaseCodeGenerator, CodeGenError
 
 
+# Go type for each Roelang type; anything else is interface{}
+_GO_TYPE_MAP = {
+    VariableType.INT: "int",
+    VariableType.NUMBER: "int",
+    VariableType.DECIMAL: "float64",
+    VariableType.TEXT: "string",
+    VariableType.STRING: "string",
+    VariableType.FLAG: "bool",
+    VariableType.YESNO: "bool",
+    VariableType.BOOLEAN: "bool",
+    VariableType.DATE: "string",  # Store as ISO string
+    VariableType.LIST_OF: "[]interface{}",
+    VariableType.GROUP_OF: "[]interface{}",
+    VariableType.ARRAY: "[]interface{}",
+}
+
+# Go time layout for each Roelang date format pattern
+_DATE_LAYOUTS = {
+    "MM/dd/yyyy": "01/02/2006",
+    "dd/MM/yyyy": "02/01/2006",
+    "MMM dd, yyyy": "Jan 02, 2006",
+    "long": "Monday, January 02, 2006",
+    "short": "01/02/06",
+    "iso": "2006-01-02",
+}
+
+# fmt verbs for decimal and whole number format patterns
+_DECIMAL_FORMATS = {
+    "0.00": "%.2f",
+    "$0.00": "$%.2f",
+    "percent": "%.2f%%",
+}
+_NUMBER_FORMATS = {
+    "0000": "%04d",
+    "hex": "0x%X",
+    "oct": "0o%o",
+    "bin": "0b%b",
+}
+
+# Inline Go formatting code for each pattern, built once from the tables
+# above; the formatted expression is substituted for {}
+_DATE_TEMPLATES = {
+    pattern: 'func() string {{ t, _ := time.Parse("2006-01-02", {}); return t.Format("%s") }}()' % layout
+    for pattern, layout in _DATE_LAYOUTS.items()
+}
+_SPRINTF_TEMPLATE = 'fmt.Sprintf("%s", {})'
+_DECIMAL_TEMPLATES = {pattern: _SPRINTF_TEMPLATE % verb for pattern, verb in _DECIMAL_FORMATS.items()}
+_NUMBER_TEMPLATES = {pattern: _SPRINTF_TEMPLATE % verb for pattern, verb in _NUMBER_FORMATS.items()}
+_DEFAULT_DECIMAL_TEMPLATE = _SPRINTF_TEMPLATE % "%.2f"
+_DEFAULT_NUMBER_TEMPLATE = _SPRINTF_TEMPLATE % "%d"
+
+# Placeholder bodies closing a loop and a struct method
+_LOOP_STUB = ("\t// Loop body", "}")
+_METHOD_STUB = ("\t// Method body", "\treturn nil", "}")
+
+# Go helper functions emitted on first use: name -> (imports, source lines)
+_HELPERS = {
+    "displaySlice": (("fmt", "os", "strings"), (
+        "func displaySlice(values []interface{}) {",
+        "\tvar b strings.Builder",
+        "\tb.WriteByte('[')",
+        "\tfor i, item := range values {",
+        "\t\tif i > 0 {",
+        "\t\t\tb.WriteString(\", \")",
+        "\t\t}",
+        "\t\tfmt.Fprint(&b, item)",
+        "\t}",
+        "\tb.WriteString(\"]\\n\")",
+        "\tos.Stdout.WriteString(b.String())",
+        "}",
+    )),
+    "displayInt": (("os", "strconv"), (
+        "func displayInt(value int) {",
+        "\tos.Stdout.WriteString(strconv.Itoa(value) + \"\\n\")",
+        "}",
+    )),
+    "displayFloat": (("os", "strconv"), (
+        "func displayFloat(value float64) {",
+        "\tos.Stdout.WriteString(strconv.FormatFloat(value, 'g', -1, 64) + \"\\n\")",
+        "}",
+    )),
+    "displayBool": (("os", "strconv"), (
+        "func displayBool(value bool) {",
+        "\tos.Stdout.WriteString(strconv.FormatBool(value) + \"\\n\")",
+        "}",
+    )),
+}
+
+# Display helper for each exactly known, non-string Go type
+_TYPED_DISPLAY_HELPERS = {"int": "displayInt", "float64": "displayFloat", "bool": "displayBool"}
+
+# Display helper for each collection type, whose values are Go slices
+_SLICE_DISPLAY_HELPERS = {
+    VariableType.ARRAY: "displaySlice",
+    VariableType.LIST_OF: "displaySlice",
+    VariableType.GROUP_OF: "displaySlice",
+}
+
+# Imports needed by each native emitter, in the order they are written
+_HTTP_CALL_IMPORTS = dict.fromkeys(("net/http", "io", "encoding/json", "bytes", "fmt", "log"))
+_HTTP_SERVER_IMPORTS = dict.fromkeys(("net/http", "fmt", "log", "encoding/json", "io"))
+_SQL_IMPORTS = dict.fromkeys(("database/sql", "fmt", "log"))
+
+# Blank import registering the database/sql driver for each database type,
+# and the name the driver registers under
+_SQLITE_DRIVER = ('_ "github.com/mattn/go-sqlite3"', "sqlite3")
+_SQL_DRIVERS = {
+    'postgres': ('_ "github.com/lib/pq"', "postgres"),
+    'mysql': ('_ "github.com/go-sql-driver/mysql"', "mysql"),
+}
+
+# Go statements that abort when the preceding call returned an error
+_FATAL_ON_ERROR = ("if err != nil {", "\tlog.Fatal(err)", "}")
+
+# Go statements sending the prepared request and reading the response body
+_HTTP_SEND = (
+    *_FATAL_ON_ERROR,
+    "client := &http.Client{}",
+    "resp, err := client.Do(req)",
+    *_FATAL_ON_ERROR,
+    "defer resp.Body.Close()",
+    "body, err := io.ReadAll(resp.Body)",
+    *_FATAL_ON_ERROR,
+)
+
+# Go statements printing a response that is not stored in a variable
+_HTTP_PRINT_RESPONSE = (
+    'fmt.Printf("Response Status: %s\\n", resp.Status)',
+    'fmt.Printf("Response Body: %s\\n", string(body))',
+)
+
+# Go statements printing each row of a query not stored in a variable
+_SQL_PRINT_ROWS = (
+    "for rows.Next() {",
+    "\tvar row interface{}",
+    "\trows.Scan(&row)",
+    "\tfmt.Println(row)",
+    "}",
+)
+
+# Go type of a literal value, by its Python type
+_LITERAL_GO_TYPES = {str: "string", bool: "bool", int: "int", float: "float64"}
+
+# Go source for literal values other than numbers, which use str()
+_LITERAL_FORMATTERS = {
+    str: lambda value: f'"{value}"',
+    bool: lambda value: "true" if value else "false",
+}
+
+# Go expression converting a value of each type to a string, for concatenation
+_GO_TO_STRING = {
+    "string": "{}",
+    "int": "strconv.Itoa({})",
+    "float64": "strconv.FormatFloat({}, 'g', -1, 64)",
+    "bool": "strconv.FormatBool({})",
+}
+
+# Go source of a native net/http handler. It is the same for every serve
+# statement apart from the substituted names, so it is built once at import.
+_HTTP_HANDLER_TEMPLATE = Template("""\
+func ${handler_name}(w http.ResponseWriter, r *http.Request) {
+\t// Set content type
+\tw.Header().Set("Content-Type", "application/json")
+\t
+\t// Check method
+\tif r.Method != "${method}" {
+\t\thttp.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
+\t\treturn
+\t}
+\t
+\t// Read request body
+\tbody, err := io.ReadAll(r.Body)
+\tif err != nil {
+\t\thttp.Error(w, "Error reading body", http.StatusBadRequest)
+\t\treturn
+\t}
+\t
+\t// Process request (placeholder)
+\tvar requestData interface{}
+\tif len(body) > 0 {
+\t\tjson.Unmarshal(body, &requestData)
+\t}
+\t
+\t// Generate response
+\tresponse := map[string]interface{}{
+\t\t"message": "Hello from Roelang server",
+\t\t"method": "${method}",
+\t\t"path": "${endpoint}",
+\t\t"data": requestData,
+\t}
+\t
+\t// Send JSON response
+\tjsonResponse, _ := json.Marshal(response)
+\tw.Write(jsonResponse)
+}""")
+
+
+# Template rendering each file of a generated Fiber project
+_FIBER_TEMPLATES = {
+    'go.mod': 'go.mod.jinja2',
+    'main.go': 'main.go.jinja2',
+    'models.go': 'models.go.jinja2',
+    'database.go': 'database.go.jinja2',
+    'routes.go': 'routes.go.jinja2',
+    'handlers.go': 'handlers.go.jinja2',
+    '.env': '.env.jinja2',
+}
+
+# Action name prefix for each HTTP method, and whether the resource name is
+# always made singular; GET only uses the singular for /:id endpoints
+_ACTION_RULES = {
+    'get': ('Get', False),
+    'post': ('Create', True),
+    'put': ('Update', True),
+    'delete': ('Delete', True),
+}
+
+# Lowercased template name of each data field type seen so far, seeded
+# with the built-in type names the parser produces
+_FIELD_TYPE_NAMES: Dict[Any, str] = {vt.value: vt.value for vt in VariableType}
+
+# Directory holding compiled Jinja templates between compiler runs
+_JINJA_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".droelang", "cache", "jinja")
+
+# Jinja environments shared by every generator, keyed by template directory
+_JINJA_ENVS: Dict[str, Any] = {}
+
+
+def _jinja_env(template_dir: str):
+    """Shared Jinja environment for a template directory.
+    
+    Templates are compiled on first use and kept in the environment's
+    cache, so later generators render them without parsing them again.
+    The compiled code is also stored under ~/.droelang/cache/jinja, so
+    later compiler runs skip parsing too; Jinja checks each entry against
+    the template source. Jinja itself is only imported once a framework
+    project is generated.
+    """
+    env = _JINJA_ENVS.get(template_dir)
+    if env is None:
+        from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+        bytecode_cache = None  # Unwritable home: compile in memory only
+        try:
+            os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
+            # Jinja writes the cache while rendering and does not catch errors
+            # there, so an existing but read-only directory must not be used
+            if os.access(_JINJA_CACHE_DIR, os.W_OK):
+                bytecode_cache = FileSystemBytecodeCache(_JINJA_CACHE_DIR)
+        except OSError:
+            pass
+        env = _JINJA_ENVS[template_dir] = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False
+        )
+    return env
+
+
+class _RenderedProjectFiles(Mapping):
+    """Project files keyed by path, each rendered from its template on access.
+    
+    Rendered files are not kept, so a caller writing the project out holds
+    one file's content at a time rather than the whole project.
+    """
+    
+    __slots__ = ('_env', '_templates', '_context')
+    
+    def __init__(self, env, templates: Dict[str, str], context: Dict[str, Any]):
+        self._env = env
+        self._templates = templates
+        self._context = context
+    
+    def __getitem__(self, filename: str) -> str:
+        return self._env.get_template(self._templates[filename]).render(self._context)
+    
+    def __iter__(self):
+        return iter(self._templates)
+    
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
 class GoCodeGenerator(BaseCodeGenerator):
     """Generates Go code from Roelang AST."""
     
+    __slots__ = ('framework', 'database_config', 'package', 'imports', 'type_definitions',
+                 'function_definitions', 'main_code', 'variables', '_type_cache',
+                 '_static_types', '_expression_cache', '_used_helpers', 'template_dir',
+                 'data_definitions', 'serve_actions', '_statement_emitters',
+                 '_expression_emitters', '_formatters', '_fiber_collectors')
+    
     def __init__(self, framework=None, database_config=None, package=None):
         super().__init__()
         self.framework = framework
         self.database_config = database_config or {}
         self.package = package
-        self.imports = set()
+        # Insertion-ordered set of import paths
+        self.imports: Dict[str, None] = {}
         self.type_definitions = []
         self.function_definitions = []
         self.main_code = []
         self.variables = {}  # Track variable types for Go typing
+        self._type_cache: Dict[int, VariableType] = {}  # infer_type results by node id
+        self._static_types: Dict[str, str] = {}  # Exact Go types of variables, where known
+        self._expression_cache: Dict[int, str] = {}  # Emitted Go code by node id
+        self._used_helpers = set()  # Names of _HELPERS functions already emitted
         
-        # Setup Jinja2 environment for templates
-        template_dir = os.path.join(os.path.dirname(__file__), 'templates', self.framework or 'fiber')
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        # Templates for framework projects; the Jinja2 environment is only
+        # set up when one is generated
+        self.template_dir = os.path.join(os.path.dirname(__file__), 'templates', self.framework or 'fiber')
         
         # Collect data for template context
         self.data_definitions = []
         self.serve_actions = []
+        
+        # Emitters keyed by AST node class, so dispatch is one dict lookup
+        self._statement_emitters = {
+            DisplayStatement: self.emit_display_statement,
+            Assignment: self.emit_assignment,
+            IfStatement: self.emit_if_statement,
+            WhileLoop: self.emit_while_loop,
+            ForEachLoop: self.emit_foreach_loop,
+            ActionDefinition: self.emit_action_definition,
+            ApiCallStatement: self.emit_api_call,
+            DatabaseStatement: self.emit_database_statement,
+            ServeStatement: self.emit_serve_statement,
+            ModuleDefinition: self.emit_module_definition,
+        }
+        self._expression_emitters = {
+            Literal: self._emit_literal,
+            Identifier: self._emit_identifier,
+            BinaryOp: self._emit_operation,
+            ArithmeticOp: self._emit_operation,
+            ArrayLiteral: self._emit_array_literal,
+            StringInterpolation: self.emit_string_interpolation,
+            FormatExpression: self._emit_format_expression,
+        }
+        # Inline formatting for each formattable type of a format expression
+        self._formatters = {
+            VariableType.DATE: self._inline_date_formatting,
+            VariableType.DECIMAL: self._inline_decimal_formatting,
+            VariableType.INT: self._inline_number_formatting,
+            VariableType.NUMBER: self._inline_number_formatting,
+        }
+        # Template context collectors for the statements a Fiber project uses
+        self._fiber_collectors = {
+            DataDefinition: self._collect_data_definition,
+            ServeStatement: self._collect_serve_action,
+        }
+    
+    @property
+    def jinja_env(self):
+        """Shared Jinja2 environment for this generator's templates."""
+        return _jinja_env(self.template_dir)
     
     def generate(self, program: Program) -> str:
         """Generate Go code from AST."""
@@ -50,17 +385,13 @@ class GoCodeGenerator(BaseCodeGenerator):
         self.function_definitions.clear()
         self.main_code.clear()
         self.variables.clear()
+        self._type_cache.clear()
+        self._static_types.clear()
+        self._expression_cache.clear()
+        self._used_helpers.clear()
         
-        # Add core imports
-        self.imports.add("fmt")
-        self.imports.add("strconv")
-        self.imports.add("time")
-        
-        if self.is_core_lib_enabled('math_utils'):
-            self.imports.add("math")
-        
-        if self.is_core_lib_enabled('string_utils'):
-            self.imports.add("strings")
+        # Imports are added by the code paths that use them, since Go
+        # rejects a file with unused imports
         
         # Process all statements
         for stmt in program.statements:
@@ -74,48 +405,19 @@ class GoCodeGenerator(BaseCodeGenerator):
         # Parse AST to extract data definitions and serve actions
         self._parse_ast_for_fiber(program)
         
-        # Prepare template context
+        # Prepare template context; the lists are copied because files are
+        # rendered when read, possibly after this generator has moved on
         context = {
             'package_name': self.package or 'go_fiber_app',  # Use configured package name
-            'data_definitions': self.data_definitions,
-            'actions': self.serve_actions,
+            'data_definitions': list(self.data_definitions),
+            'actions': list(self.serve_actions),
             'database': self.database_config
         }
         
-        # Generate project files
-        project_files = {}
-        
-        # Go module file
-        template = self.jinja_env.get_template('go.mod.jinja2')
-        project_files['go.mod'] = template.render(context)
-        
-        # Main server file
-        template = self.jinja_env.get_template('main.go.jinja2')
-        project_files['main.go'] = template.render(context)
-        
-        # Models file
-        template = self.jinja_env.get_template('models.go.jinja2')
-        project_files['models.go'] = template.render(context)
-        
-        # Database file
-        template = self.jinja_env.get_template('database.go.jinja2')
-        project_files['database.go'] = template.render(context)
-        
-        # Routes file
-        template = self.jinja_env.get_template('routes.go.jinja2')
-        project_files['routes.go'] = template.render(context)
-        
-        # Handlers file
-        template = self.jinja_env.get_template('handlers.go.jinja2')
-        project_files['handlers.go'] = template.render(context)
-        
-        # Environment file
-        template = self.jinja_env.get_template('.env.jinja2')
-        project_files['.env'] = template.render(context)
-        
-        # Return in the format expected by the target factory
+        # Return in the format expected by the target factory; project
+        # files are rendered as the caller reads them
         return {
-            'files': project_files,
+            'files': _RenderedProjectFiles(self.jinja_env, _FIBER_TEMPLATES, context),
             'project_root': context['package_name'],
             'language': 'go',
             'framework': self.framework
@@ -123,204 +425,205 @@ class GoCodeGenerator(BaseCodeGenerator):
     
     def _parse_ast_for_fiber(self, program: Program):
         """Parse AST to extract data definitions and serve actions."""
+        collectors = self._fiber_collectors
         for stmt in program.statements:
-            if isinstance(stmt, DataDefinition):
-                # Convert DataDefinition to template-friendly format
-                data_def = {
-                    'name': stmt.name,
-                    'fields': []
-                }
-                
-                for field in stmt.fields:
-                    field_info = {
-                        'name': field.name,
-                        'type': str(field.type).lower(),
-                        'required': 'required' in getattr(field, 'annotations', [])
-                    }
-                    data_def['fields'].append(field_info)
-                
-                self.data_definitions.append(data_def)
-            
-            elif isinstance(stmt, ServeStatement):
-                # Convert ServeStatement to template-friendly format
-                # Generate action name from method and endpoint
-                action_name = self._generate_action_name(stmt.method, stmt.endpoint)
-                action = {
-                    'name': action_name,
-                    'method': stmt.method.upper(),
-                    'path': stmt.endpoint
-                }
-                self.serve_actions.append(action)
+            collector = collectors.get(type(stmt))
+            if collector is not None:
+                collector(stmt)
+    
+    def _collect_data_definition(self, stmt: DataDefinition):
+        """Convert a DataDefinition to template-friendly format."""
+        type_names = _FIELD_TYPE_NAMES
+        fields = []
+        for field in stmt.fields:
+            field_type = field.type
+            type_name = type_names.get(field_type)
+            if type_name is None:
+                type_name = type_names[field_type] = str(field_type).lower()
+            fields.append({
+                'name': field.name,
+                'type': type_name,
+                'required': 'required' in getattr(field, 'annotations', ())
+            })
+        
+        self.data_definitions.append({
+            'name': stmt.name,
+            'fields': fields
+        })
+    
+    def _collect_serve_action(self, stmt: ServeStatement):
+        """Convert a ServeStatement to template-friendly format."""
+        # Generate action name from method and endpoint
+        action_name = self._generate_action_name(stmt.method, stmt.endpoint)
+        action = {
+            'name': action_name,
+            'method': stmt.method.upper(),
+            'path': stmt.endpoint
+        }
+        self.serve_actions.append(action)
     
     def _generate_action_name(self, method: str, endpoint: str) -> str:
         """Generate action name from HTTP method and endpoint."""
         # Convert /api/users -> GetUsers, /api/users/:id -> GetUser
-        path_parts = [part for part in endpoint.strip('/').split('/') if not part.startswith(':')]
-        if path_parts:
-            resource = path_parts[-1].title()  # 'users' -> 'Users'
-            if method.lower() == 'get' and ':id' in endpoint:
-                # GET /api/users/:id -> GetUser (singular)
-                resource = resource.rstrip('s') if resource.endswith('s') else resource
-                return f"Get{resource}"
-            elif method.lower() == 'get':
-                # GET /api/users -> GetUsers (plural)
-                return f"Get{resource}"
-            elif method.lower() == 'post':
-                # POST /api/users -> CreateUser
-                resource = resource.rstrip('s') if resource.endswith('s') else resource
-                return f"Create{resource}"
-            elif method.lower() == 'put':
-                # PUT /api/users/:id -> UpdateUser
-                resource = resource.rstrip('s') if resource.endswith('s') else resource
-                return f"Update{resource}"
-            elif method.lower() == 'delete':
-                # DELETE /api/users/:id -> DeleteUser
-                resource = resource.rstrip('s') if resource.endswith('s') else resource
-                return f"Delete{resource}"
+        rule = _ACTION_RULES.get(method.lower())
+        if rule is not None:
+            path_parts = [part for part in endpoint.strip('/').split('/') if not part.startswith(':')]
+            if path_parts:
+                prefix, singular = rule
+                resource = path_parts[-1].title()  # 'users' -> 'Users'
+                if singular or ':id' in endpoint:
+                    # GET /api/users/:id -> GetUser, POST /api/users -> CreateUser
+                    resource = resource.rstrip('s')
+                return f"{prefix}{resource}"
         
         # Fallback
         return f"{method.title()}Handler"
     
     def _build_go_file(self) -> str:
         """Build the complete Go file."""
-        lines = []
+        # Sections are written straight into one buffer instead of being
+        # collected into a list of lines and joined at the end
+        out = io.StringIO()
+        write = out.write
         
         # Package declaration
-        lines.append("package main")
-        lines.append("")
+        write("package main\n\n")
         
         # Add imports
         if self.imports:
-            lines.append("import (")
-            for imp in sorted(self.imports):
-                lines.append(f'\\t"{imp}"')
-            lines.append(")")
-            lines.append("")
+            write("import (\n\t")
+            # Blank driver imports are recorded with their quotes already
+            write("\n\t".join(imp if '"' in imp else f'"{imp}"' for imp in self.imports))
+            write("\n)\n\n")
         
         # No separate runtime library needed - using inline code generation
         
         # Add type definitions
         for type_def in self.type_definitions:
-            lines.extend(type_def)
-            lines.append("")
+            for line in type_def:
+                write(line)
+                write("\n")
+            write("\n")
         
         # Add function definitions
         for func_def in self.function_definitions:
-            lines.extend(func_def)
-            lines.append("")
+            for line in func_def:
+                write(line)
+                write("\n")
+            write("\n")
         
         # Add main function
-        lines.append("func main() {")
-        for line in self.main_code:
-            lines.append(f"\\t{line}")
-        lines.append("}")
-        
-        return "\n".join(lines)
+        # Every main body line takes one tab of indentation
+        write("func main() {\n")
+        if self.main_code:
+            write("\t")
+            write("\n\t".join(self.main_code))
+            write("\n")
+        write("}")
+        
+        return out.getvalue()
+    
     
+    def _infer(self, node: ASTNode) -> VariableType:
+        """infer_type, remembered per node for the rest of this generate() call."""
+        key = id(node)
+        var_type = self._type_cache.get(key)
+        if var_type is None:
+            var_type = self._type_cache[key] = self.infer_type(node)
+        return var_type
     
     def _get_go_type(self, var_type: VariableType) -> str:
         """Get Go type for Roelang type."""
-        type_map = {
-            VariableType.INT: "int",
-            VariableType.NUMBER: "int", 
-            VariableType.DECIMAL: "float64",
-            VariableType.TEXT: "string",
-            VariableType.STRING: "string",
-            VariableType.FLAG: "bool",
-            VariableType.YESNO: "bool",
-            VariableType.BOOLEAN: "bool",
-            VariableType.DATE: "string",  # Store as ISO string
-            VariableType.LIST_OF: "[]interface{}",
-            VariableType.GROUP_OF: "[]interface{}",
-            VariableType.ARRAY: "[]interface{}",
-        }
-        return type_map.get(var_type, "interface{}")
+        return _GO_TYPE_MAP.get(var_type, "interface{}")
     
     def emit_statement(self, stmt: ASTNode):
         """Emit code for a statement."""
-        if isinstance(stmt, DisplayStatement):
-            self.emit_display_statement(stmt)
-        elif isinstance(stmt, Assignment):
-            self.emit_assignment(stmt)
-        elif isinstance(stmt, IfStatement):
-            self.emit_if_statement(stmt)
-        elif isinstance(stmt, WhileLoop):
-            self.emit_while_loop(stmt)
-        elif isinstance(stmt, ForEachLoop):
-            self.emit_foreach_loop(stmt)
-        elif isinstance(stmt, ActionDefinition):
-            self.emit_action_definition(stmt)
-        elif isinstance(stmt, ApiCallStatement):
-            self.emit_api_call(stmt)
-        elif isinstance(stmt, DatabaseStatement):
-            self.emit_database_statement(stmt)
-        elif isinstance(stmt, ServeStatement):
-            self.emit_serve_statement(stmt)
-        elif isinstance(stmt, ModuleDefinition):
-            self.emit_module_definition(stmt)
-        else:
+        emitter = self._statement_emitters.get(type(stmt))
+        if emitter is None:
             self.main_code.append(f"// TODO: Implement {type(stmt).__name__}")
+        else:
+            emitter(stmt)
     
     def emit_expression(self, expr: ASTNode) -> str:
-        """Emit code for an expression and return the expression string."""
-        if isinstance(expr, Literal):
-            if isinstance(expr.value, str):
-                return f'"{expr.value}"'
-            elif isinstance(expr.value, bool):
-                return "true" if expr.value else "false"
+        """Emit code for an expression and return the expression string.
+        
+        The Go code for a node is remembered for the rest of the generate()
+        call, so a subtree referenced more than once is only emitted once.
+        """
+        key = id(expr)
+        code = self._expression_cache.get(key)
+        if code is None:
+            emitter = self._expression_emitters.get(type(expr))
+            if emitter is None:
+                code = f"/* TODO: {type(expr).__name__} */"
             else:
-                return str(expr.value)
-        elif isinstance(expr, Identifier):
-            return expr.name
-        elif isinstance(expr, BinaryOp):
-            left = self.emit_expression(expr.left)
-            right = self.emit_expression(expr.right)
-            
-            # Handle Go-specific operators
-            if expr.operator == "==":
-                return f"({left} == {right})"
-            elif expr.operator == "!=":
-                return f"({left} != {right})"
-            else:
-                return f"({left} {expr.operator} {right})"
-        elif isinstance(expr, ArithmeticOp):
-            left = self.emit_expression(expr.left)
-            right = self.emit_expression(expr.right)
-            return f"({left} {expr.operator} {right})"
-        elif isinstance(expr, ArrayLiteral):
-            elements = [self.emit_expression(elem) for elem in expr.elements]
-            return f"[]interface{{{{{', '.join(elements)}}}}}"
-        elif isinstance(expr, StringInterpolation):
-            return self.emit_string_interpolation(expr)
-        elif isinstance(expr, FormatExpression):
-            expr_str = self.emit_expression(expr.expression)
-            pattern = f'"{expr.format_pattern}"'
-            expr_type = self.infer_type(expr.expression)
-            
-            if expr_type == VariableType.DATE:
-                return self._inline_date_formatting(expr_str, expr.format_pattern)
-            elif expr_type == VariableType.DECIMAL:
-                return self._inline_decimal_formatting(expr_str, expr.format_pattern)
-            elif self._is_numeric_type(expr_type):
-                return self._inline_number_formatting(expr_str, expr.format_pattern)
-            else:
-                return expr_str
-        else:
-            return f"/* TODO: {type(expr).__name__} */"
+                code = emitter(expr)
+            self._expression_cache[key] = code
+        return code
+    
+    def _emit_literal(self, expr: Literal) -> str:
+        """Emit a literal value."""
+        value = expr.value
+        return _LITERAL_FORMATTERS.get(type(value), str)(value)
+    
+    def _emit_identifier(self, expr: Identifier) -> str:
+        """Emit a variable reference."""
+        return expr.name
+    
+    def _emit_operation(self, expr: ASTNode) -> str:
+        """Emit a binary or arithmetic operation.
+        
+        Both node classes share the left/operator/right fields, and Go spells
+        every Roelang operator the same way, so one emitter serves both.
+        """
+        left = self.emit_expression(expr.left)
+        right = self.emit_expression(expr.right)
+        return f"({left} {expr.operator} {right})"
+    
+    def _emit_array_literal(self, expr: ArrayLiteral) -> str:
+        """Emit an array literal as a Go slice."""
+        elements = [self.emit_expression(elem) for elem in expr.elements]
+        return "[]interface{}{" + ", ".join(elements) + "}"
+    
+    def _emit_format_expression(self, expr: FormatExpression) -> str:
+        """Emit a format expression with inline formatting."""
+        expr_str = self.emit_expression(expr.expression)
+        formatter = self._formatters.get(self._infer(expr.expression))
+        if formatter is None:
+            return expr_str
+        return formatter(expr_str, expr.format_pattern)
     
     def emit_display_statement(self, stmt: DisplayStatement):
         """Emit display statement with native formatting."""
-        expr_str = self.emit_expression(stmt.expression)
-        expr_type = self.infer_type(stmt.expression)
-        
-        # Handle boolean formatting inline
-        if expr_type == VariableType.BOOLEAN or expr_type == VariableType.FLAG or expr_type == VariableType.YESNO:
-            self.main_code.append(f'if {expr_str} {{ fmt.Println("true") }} else {{ fmt.Println("false") }}')
-        # Handle slice formatting inline  
-        elif expr_type in [VariableType.LIST_OF, VariableType.GROUP_OF, VariableType.ARRAY]:
-            self.main_code.append(f'fmt.Print("["); for i, item := range {expr_str} {{ if i > 0 {{ fmt.Print(", ") }}; fmt.Print(item) }}; fmt.Println("]")')
-        else:
-            self.main_code.append(f"fmt.Println({expr_str})")
+        self.main_code.append(self._display_code(stmt.expression))
+    
+    def _display_code(self, expr: ASTNode) -> str:
+        """Go statement printing an expression, chosen by its static type.
+        
+        Slices, and values whose Go type is known exactly, are printed by
+        typed helpers emitted on first use; everything else uses fmt.Println.
+        """
+        expr_str = self.emit_expression(expr)
+        
+        # Slices are formatted into one buffer and written with a single
+        # call; values of an exactly known Go type skip fmt's interface{}
+        # handling
+        helper = (_SLICE_DISPLAY_HELPERS.get(self._infer(expr))
+                  or _TYPED_DISPLAY_HELPERS.get(self._static_go_type(expr)))
+        if helper is not None:
+            self._use_helper(helper)
+            return f"{helper}({expr_str})"
+        self.imports["fmt"] = None
+        return f"fmt.Println({expr_str})"
+    
+    def _use_helper(self, name: str):
+        """Emit a Go helper function from _HELPERS the first time it is used."""
+        if name in self._used_helpers:
+            return
+        self._used_helpers.add(name)
+        imports, lines = _HELPERS[name]
+        self.imports.update(dict.fromkeys(imports))
+        self.function_definitions.append(list(lines))
     
     def emit_assignment(self, stmt: Assignment):
         """Emit assignment statement."""
@@ -331,47 +634,48 @@ class GoCodeGenerator(BaseCodeGenerator):
             # First assignment - use Go's type inference
             self.main_code.append(f"{stmt.variable} := {value_str}")
             # Try to infer type for tracking
-            inferred_type = self.infer_type(stmt.value)
+            inferred_type = self._infer(stmt.value)
             go_type = self._get_go_type(inferred_type)
             self.variables[stmt.variable] = go_type
+            static_type = self._static_go_type(stmt.value)
+            if static_type is not None:
+                self._static_types[stmt.variable] = static_type
         else:
             # Reassignment
             self.main_code.append(f"{stmt.variable} = {value_str}")
     
     def emit_if_statement(self, stmt: IfStatement):
         """Emit if statement."""
+        # The block is built locally and added to the main body in one go
         condition_str = self.emit_expression(stmt.condition)
-        self.main_code.append(f"if {condition_str} {{")
+        lines = [f"if {condition_str} {{"]
         
         # Emit then block (simplified)
         if stmt.then_body:
-            for then_stmt in stmt.then_body:
-                if isinstance(then_stmt, DisplayStatement):
-                    expr_str = self.emit_expression(then_stmt.expression)
-                    self.main_code.append(f"\\tDisplay({expr_str})")
+            lines.extend(
+                "\t" + self._display_code(then_stmt.expression)
+                for then_stmt in stmt.then_body if isinstance(then_stmt, DisplayStatement)
+            )
         
         if stmt.else_body:
-            self.main_code.append("} else {")
-            for else_stmt in stmt.else_body:
-                if isinstance(else_stmt, DisplayStatement):
-                    expr_str = self.emit_expression(else_stmt.expression)
-                    self.main_code.append(f"\\tDisplay({expr_str})")
+            lines.append("} else {")
+            lines.extend(
+                "\t" + self._display_code(else_stmt.expression)
+                for else_stmt in stmt.else_body if isinstance(else_stmt, DisplayStatement)
+            )
         
-        self.main_code.append("}")
+        lines.append("}")
+        self.main_code.extend(lines)
     
     def emit_while_loop(self, stmt: WhileLoop):
         """Emit while loop."""
         condition_str = self.emit_expression(stmt.condition)
-        self.main_code.append(f"for {condition_str} {{")
-        self.main_code.append("\\t// Loop body")
-        self.main_code.append("}")
+        self.main_code.extend((f"for {condition_str} {{", *_LOOP_STUB))
     
     def emit_foreach_loop(self, stmt: ForEachLoop):
         """Emit for-each loop."""
         collection_str = self.emit_expression(stmt.collection)
-        self.main_code.append(f"for _, {stmt.variable} := range {collection_str} {{")
-        self.main_code.append("\\t// Loop body")
-        self.main_code.append("}")
+        self.main_code.extend((f"for _, {stmt.variable} := range {collection_str} {{", *_LOOP_STUB))
     
     def emit_action_definition(self, stmt: ActionDefinition):
         """Emit action definition as Go function."""
@@ -381,11 +685,11 @@ class GoCodeGenerator(BaseCodeGenerator):
             for body_stmt in stmt.body:
                 if isinstance(body_stmt, ReturnStatement):
                     return_expr = self.emit_expression(body_stmt.expression)
-                    func_lines.append(f"\\treturn {return_expr}")
+                    func_lines.append(f"\treturn {return_expr}")
                 else:
-                    func_lines.append("\\t// Function body")
+                    func_lines.append("\t// Function body")
         else:
-            func_lines.append("\\treturn nil")
+            func_lines.append("\treturn nil")
         
         func_lines.append("}")
         self.function_definitions.append(func_lines)
@@ -401,68 +705,105 @@ class GoCodeGenerator(BaseCodeGenerator):
                 if isinstance(body_stmt, ActionDefinition):
                     method_lines = [
                         f"func ({stmt.name[0].lower()}) {stmt.name}) {body_stmt.name}() interface{{}} {{",
-                        "\\t// Method body",
-                        "\\treturn nil",
-                        "}"
+                        *_METHOD_STUB
                     ]
                     self.function_definitions.append(method_lines)
     
     def emit_string_interpolation(self, expr: StringInterpolation) -> str:
-        """Emit string interpolation using fmt.Sprintf."""
-        format_parts = []
-        args = []
-        
-        for part in expr.parts:
-            if isinstance(part, str):
-                format_parts.append(part)
-            else:
-                format_parts.append("%v")
-                args.append(self.emit_expression(part))
-        
-        format_string = ''.join(format_parts)
+        """Emit string interpolation.
+        
+        When the Go type of every interpolated value is known, the string is
+        built by concatenation, converting non-string values with strconv;
+        otherwise it falls back to fmt.Sprintf with %v.
+        """
+        pieces = self._interpolation_pieces(expr)
+        if pieces is not None:
+            if not pieces:
+                return '""'
+            if len(pieces) == 1:
+                return pieces[0]
+            return f"({' + '.join(pieces)})"
+        
+        parts = expr.parts
+        format_string = ''.join(part if isinstance(part, str) else "%v" for part in parts)
+        args = [self.emit_expression(part) for part in parts if not isinstance(part, str)]
         if args:
             args_str = ', '.join(args)
+            self.imports["fmt"] = None
             return f'fmt.Sprintf("{format_string}", {args_str})'
         else:
             return f'"{format_string}"'
     
+    def _interpolation_pieces(self, expr: StringInterpolation) -> Optional[List[str]]:
+        """Split an interpolation into Go string operands for concatenation.
+        
+        Adjacent text and constant parts are merged into one string literal,
+        and nested interpolations are spliced in so the whole string is one
+        concatenation. Returns None if any interpolated value has no
+        statically known Go type.
+        """
+        pieces = []
+        text = []
+        uses_strconv = False
+        for part in expr.parts:
+            if isinstance(part, str):
+                text.append(part)
+                continue
+            if type(part) is StringInterpolation:
+                nested = self._interpolation_pieces(part)
+                if nested is not None:
+                    if text:
+                        pieces.append(f'"{"".join(text)}"')
+                        text = []
+                    pieces.extend(nested)
+                    continue
+            go_type = self._static_go_type(part)
+            to_string = _GO_TO_STRING.get(go_type)
+            if to_string is None:
+                return None
+            if type(part) is Literal and go_type != "float64":
+                # Known at compile time, so it becomes part of the text
+                text.append(part.value if go_type == "string" else self._emit_literal(part))
+                continue
+            if text:
+                pieces.append(f'"{"".join(text)}"')
+                text = []
+            if go_type != "string":
+                uses_strconv = True
+            pieces.append(to_string.format(self.emit_expression(part)))
+        if text:
+            pieces.append(f'"{"".join(text)}"')
+        if uses_strconv:
+            self.imports["strconv"] = None
+        return pieces
+    
+    def _static_go_type(self, expr: ASTNode) -> Optional[str]:
+        """Go type of an expression when it is known exactly, else None."""
+        if type(expr) is Literal:
+            return _LITERAL_GO_TYPES.get(type(expr.value))
+        if type(expr) is Identifier:
+            return self._static_types.get(expr.name)
+        if type(expr) is StringInterpolation:
+            return "string"
+        return None
+    
     def _inline_date_formatting(self, expr_str: str, pattern: str) -> str:
         """Generate inline date formatting code."""
-        if pattern == "MM/dd/yyyy":
-            return f'func() string {{ t, _ := time.Parse("2006-01-02", {expr_str}); return t.Format("01/02/2006") }}()'
-        elif pattern == "dd/MM/yyyy":
-            return f'func() string {{ t, _ := time.Parse("2006-01-02", {expr_str}); return t.Format("02/01/2006") }}()'
-        elif pattern == "MMM dd, yyyy":
-            return f'func() string {{ t, _ := time.Parse("2006-01-02", {expr_str}); return t.Format("Jan 02, 2006") }}()'
-        elif pattern == "long":
-            return f'func() string {{ t, _ := time.Parse("2006-01-02", {expr_str}); return t.Format("Monday, January 02, 2006") }}()'
-        elif pattern == "short":
-            return f'func() string {{ t, _ := time.Parse("2006-01-02", {expr_str}); return t.Format("01/02/06") }}()'
-        elif pattern == "iso":
-            return f'func() string {{ t, _ := time.Parse("2006-01-02", {expr_str}); return t.Format("2006-01-02") }}()'
-        return expr_str
+        template = _DATE_TEMPLATES.get(pattern)
+        if template is None:
+            return expr_str
+        self.imports["time"] = None
+        return template.format(expr_str)
     
     def _inline_decimal_formatting(self, expr_str: str, pattern: str) -> str:
         """Generate inline decimal formatting code."""
-        if pattern == "0.00":
-            return f'fmt.Sprintf("%.2f", {expr_str})'
-        elif pattern == "$0.00":
-            return f'fmt.Sprintf("$%.2f", {expr_str})'
-        elif pattern == "percent":
-            return f'fmt.Sprintf("%.2f%%", {expr_str})'
-        return f'fmt.Sprintf("%.2f", {expr_str})'
+        self.imports["fmt"] = None
+        return _DECIMAL_TEMPLATES.get(pattern, _DEFAULT_DECIMAL_TEMPLATE).format(expr_str)
     
     def _inline_number_formatting(self, expr_str: str, pattern: str) -> str:
         """Generate inline number formatting code."""
-        if pattern == "0000":
-            return f'fmt.Sprintf("%04d", {expr_str})'
-        elif pattern == "hex":
-            return f'fmt.Sprintf("0x%X", {expr_str})'
-        elif pattern == "oct":
-            return f'fmt.Sprintf("0o%o", {expr_str})'
-        elif pattern == "bin":
-            return f'fmt.Sprintf("0b%b", {expr_str})'
-        return f'fmt.Sprintf("%d", {expr_str})'
+        self.imports["fmt"] = None
+        return _NUMBER_TEMPLATES.get(pattern, _DEFAULT_NUMBER_TEMPLATE).format(expr_str)
     
     def emit_api_call(self, stmt: ApiCallStatement):
         """Emit API call statement with framework or native HTTP."""
@@ -470,7 +811,7 @@ class GoCodeGenerator(BaseCodeGenerator):
             self._emit_native_http_call(stmt)
         else:
             # Fiber framework - not implemented for client calls yet
-            self.main_code.append(f"// TODO: Implement Fiber client call for {stmt.method} {stmt.url}")
+            self.main_code.append(f"// TODO: Implement Fiber client call for {stmt.method} {stmt.endpoint}")
     
     def emit_database_statement(self, stmt: DatabaseStatement):
         """Emit database statement with framework or native database access."""
@@ -491,186 +832,118 @@ class GoCodeGenerator(BaseCodeGenerator):
     def _emit_native_http_call(self, stmt: ApiCallStatement):
         """Generate native Go HTTP client call using net/http."""
         # Add required imports
-        self.imports.add("net/http")
-        self.imports.add("io")
-        self.imports.add("encoding/json")
-        self.imports.add("bytes")
-        self.imports.add("fmt")
+        self.imports.update(_HTTP_CALL_IMPORTS)
         
         # Generate HTTP request code
-        self.main_code.append(f"// HTTP {stmt.method.upper()} request to {stmt.url}")
-        
-        if stmt.body:
-            body_str = self.emit_expression(stmt.body)
-            self.main_code.append(f"requestData, err := json.Marshal({body_str})")
-            self.main_code.append("if err != nil {")
-            self.main_code.append("\tlog.Fatal(err)")
-            self.main_code.append("}")
-            self.main_code.append(f'req, err := http.NewRequest("{stmt.method.upper()}", "{stmt.url}", bytes.NewBuffer(requestData))')
-            self.main_code.append("req.Header.Set(\"Content-Type\", \"application/json\")")
+        method = stmt.method.upper()
+        lines = [f"// HTTP {method} request to {stmt.endpoint}"]
+        
+        if stmt.payload:
+            # The payload is the name of the variable holding the request body
+            lines.append(f"requestData, err := json.Marshal({stmt.payload})")
+            lines.extend(_FATAL_ON_ERROR)
+            lines.append(f'req, err := http.NewRequest("{method}", "{stmt.endpoint}", bytes.NewBuffer(requestData))')
+            lines.append("req.Header.Set(\"Content-Type\", \"application/json\")")
         else:
-            self.main_code.append(f'req, err := http.NewRequest("{stmt.method.upper()}", "{stmt.url}", nil)')
-        
-        self.main_code.append("if err != nil {")
-        self.main_code.append("\tlog.Fatal(err)")
-        self.main_code.append("}")
-        
-        # Make the request
-        self.main_code.append("client := &http.Client{}")
-        self.main_code.append("resp, err := client.Do(req)")
-        self.main_code.append("if err != nil {")
-        self.main_code.append("\tlog.Fatal(err)")
-        self.main_code.append("}")
-        self.main_code.append("defer resp.Body.Close()")
-        
-        # Handle response
-        self.main_code.append("body, err := io.ReadAll(resp.Body)")
-        self.main_code.append("if err != nil {")
-        self.main_code.append("\tlog.Fatal(err)")
-        self.main_code.append("}")
-        
-        if hasattr(stmt, 'response_var') and stmt.response_var:
-            self.main_code.append(f"var {stmt.response_var} interface{{}}")
-            self.main_code.append(f"json.Unmarshal(body, &{stmt.response_var})")
+            lines.append(f'req, err := http.NewRequest("{method}", "{stmt.endpoint}", nil)')
+        
+        # Make the request and read the response
+        lines.extend(_HTTP_SEND)
+        
+        response_var = stmt.response_variable
+        if response_var:
+            lines.append(f"var {response_var} interface{{}}")
+            lines.append(f"json.Unmarshal(body, &{response_var})")
         else:
-            self.main_code.append('fmt.Printf("Response Status: %s\\n", resp.Status)')
-            self.main_code.append('fmt.Printf("Response Body: %s\\n", string(body))')
+            lines.extend(_HTTP_PRINT_RESPONSE)
+        self.main_code.extend(lines)
     
     def _emit_native_database_operation(self, stmt: DatabaseStatement):
         """Generate native Go database operation using database/sql."""
         # Add required imports
-        self.imports.add("database/sql")
-        self.imports.add("fmt")
-        self.imports.add("log")
+        self.imports.update(_SQL_IMPORTS)
         # Add driver import based on database type
-        if hasattr(self, 'database') and self.database.get('type') == 'postgres':
-            self.imports.add('_ "github.com/lib/pq"')
-        elif hasattr(self, 'database') and self.database.get('type') == 'mysql':
-            self.imports.add('_ "github.com/go-sql-driver/mysql"')
-        else:
-            self.imports.add('_ "github.com/mattn/go-sqlite3"')
+        driver_import, driver_name = _SQL_DRIVERS.get(self.database_config.get('type'), _SQLITE_DRIVER)
+        self.imports[driver_import] = None
         
         # Database connection
-        if hasattr(self, 'database') and self.database.get('url'):
-            db_url = self.database['url']
-        else:
-            db_url = "roelang.db"
+        db_url = self.database_config.get('url') or "roelang.db"
+        # Statement details the parser may not set
+        table_name = getattr(stmt, 'table', 'data')
+        where = getattr(stmt, 'where', None)
+        result_var = getattr(stmt, 'result_var', None)
         
-        self.main_code.append(f"// Database operation: {stmt.operation}")
-        self.main_code.append(f'db, err := sql.Open("sqlite3", "{db_url}")')
-        self.main_code.append("if err != nil {")
-        self.main_code.append("\tlog.Fatal(err)")
-        self.main_code.append("}")
-        self.main_code.append("defer db.Close()")
+        lines = [f"// Database operation: {stmt.operation}"]
+        lines.append(f'db, err := sql.Open("{driver_name}", "{db_url}")')
+        lines.extend(_FATAL_ON_ERROR)
+        lines.append("defer db.Close()")
         
         if stmt.operation == 'CREATE':
             # Create table operation
-            table_name = getattr(stmt, 'table', 'data')
-            self.main_code.append(f'_, err = db.Exec("CREATE TABLE IF NOT EXISTS {table_name} (id INTEGER PRIMARY KEY)")')
+            lines.append(f'_, err = db.Exec("CREATE TABLE IF NOT EXISTS {table_name} (id INTEGER PRIMARY KEY)")')
         elif stmt.operation == 'INSERT':
             # Insert operation
-            table_name = getattr(stmt, 'table', 'data')
-            self.main_code.append(f'_, err = db.Exec("INSERT INTO {table_name} DEFAULT VALUES")')
+            lines.append(f'_, err = db.Exec("INSERT INTO {table_name} DEFAULT VALUES")')
         elif stmt.operation == 'SELECT':
             # Select operation
-            table_name = getattr(stmt, 'table', 'data')
-            if hasattr(stmt, 'where') and stmt.where:
-                where_str = self.emit_expression(stmt.where)
-                self.main_code.append(f'rows, err := db.Query("SELECT * FROM {table_name} WHERE {where_str}")')
+            if where:
+                where_str = self.emit_expression(where)
+                lines.append(f'rows, err := db.Query("SELECT * FROM {table_name} WHERE {where_str}")')
             else:
-                self.main_code.append(f'rows, err := db.Query("SELECT * FROM {table_name}")')
+                lines.append(f'rows, err := db.Query("SELECT * FROM {table_name}")')
             
-            self.main_code.append("if err != nil {")
-            self.main_code.append("\tlog.Fatal(err)")
-            self.main_code.append("}")
-            self.main_code.append("defer rows.Close()")
+            lines.extend(_FATAL_ON_ERROR)
+            lines.append("defer rows.Close()")
             
-            if hasattr(stmt, 'result_var') and stmt.result_var:
-                self.main_code.append(f"var {stmt.result_var} []interface{{}}")
-                self.main_code.append("for rows.Next() {")
-                self.main_code.append("\tvar row interface{}")
-                self.main_code.append("\trows.Scan(&row)")
-                self.main_code.append(f"\t{stmt.result_var} = append({stmt.result_var}, row)")
-                self.main_code.append("}")
+            if result_var:
+                lines.extend((
+                    f"var {result_var} []interface{{}}",
+                    "for rows.Next() {",
+                    "\tvar row interface{}",
+                    "\trows.Scan(&row)",
+                    f"\t{result_var} = append({result_var}, row)",
+                    "}",
+                ))
             else:
-                self.main_code.append("for rows.Next() {")
-                self.main_code.append("\tvar row interface{}")
-                self.main_code.append("\trows.Scan(&row)")
-                self.main_code.append("\tfmt.Println(row)")
-                self.main_code.append("}")
-            return  # Skip the general error check since we handled it
+                lines.extend(_SQL_PRINT_ROWS)
+            # The query's error was checked above, so skip the general check
+            self.main_code.extend(lines)
+            return
         elif stmt.operation == 'UPDATE':
             # Update operation
-            table_name = getattr(stmt, 'table', 'data')
-            self.main_code.append(f'_, err = db.Exec("UPDATE {table_name} SET data = data")')
+            lines.append(f'_, err = db.Exec("UPDATE {table_name} SET data = data")')
         elif stmt.operation == 'DELETE':
             # Delete operation
-            table_name = getattr(stmt, 'table', 'data')
-            if hasattr(stmt, 'where') and stmt.where:
-                where_str = self.emit_expression(stmt.where)
-                self.main_code.append(f'_, err = db.Exec("DELETE FROM {table_name} WHERE {where_str}")')
+            if where:
+                where_str = self.emit_expression(where)
+                lines.append(f'_, err = db.Exec("DELETE FROM {table_name} WHERE {where_str}")')
             else:
-                self.main_code.append(f'_, err = db.Exec("DELETE FROM {table_name}")')
+                lines.append(f'_, err = db.Exec("DELETE FROM {table_name}")')
         
-        self.main_code.append("if err != nil {")
-        self.main_code.append("\tlog.Fatal(err)")
-        self.main_code.append("}")
+        lines.extend(_FATAL_ON_ERROR)
+        self.main_code.extend(lines)
     
     def _emit_native_http_server(self, stmt: ServeStatement):
         """Generate native Go HTTP server using net/http."""
         # Add required imports
-        self.imports.add("net/http")
-        self.imports.add("fmt")
-        self.imports.add("log")
-        self.imports.add("encoding/json")
-        self.imports.add("io")
+        self.imports.update(_HTTP_SERVER_IMPORTS)
         
         # Generate handler function
         handler_name = f"{stmt.method.lower()}{stmt.endpoint.replace('/', '_').replace(':', '')}_handler"
         
-        handler_lines = [
-            f"func {handler_name}(w http.ResponseWriter, r *http.Request) {{",
-            "\t// Set content type",
-            "\tw.Header().Set(\"Content-Type\", \"application/json\")",
-            "\t",
-            f"\t// Check method",
-            f"\tif r.Method != \"{stmt.method.upper()}\" {{",
-            "\t\thttp.Error(w, \"Method not allowed\", http.StatusMethodNotAllowed)",
-            "\t\treturn",
-            "\t}",
-            "\t",
-            "\t// Read request body",
-            "\tbody, err := io.ReadAll(r.Body)",
-            "\tif err != nil {",
-            "\t\thttp.Error(w, \"Error reading body\", http.StatusBadRequest)",
-            "\t\treturn",
-            "\t}",
-            "\t",
-            "\t// Process request (placeholder)",
-            "\tvar requestData interface{}",
-            "\tif len(body) > 0 {",
-            "\t\tjson.Unmarshal(body, &requestData)",
-            "\t}",
-            "\t",
-            "\t// Generate response",
-            '\tresponse := map[string]interface{}{',
-            '\t\t"message": "Hello from Roelang server",',
-            f'\t\t"method": "{stmt.method.upper()}",',
-            f'\t\t"path": "{stmt.endpoint}",',
-            "\t\t\"data\": requestData,",
-            "\t}",
-            "\t",
-            "\t// Send JSON response",
-            "\tjsonResponse, _ := json.Marshal(response)",
-            "\tw.Write(jsonResponse)",
-            "}"
-        ]
+        handler_lines = [_HTTP_HANDLER_TEMPLATE.substitute(
+            handler_name=handler_name,
+            method=stmt.method.upper(),
+            endpoint=stmt.endpoint
+        )]
         
         self.function_definitions.append(handler_lines)
         
         # Add server startup code
         port = getattr(stmt, 'port', 8080)
-        self.main_code.append(f"// Start HTTP server for {stmt.method.upper()} {stmt.endpoint}")
-        self.main_code.append(f'http.HandleFunc("{stmt.endpoint}", {handler_name})')
-        self.main_code.append(f'fmt.Println("Server starting on http://localhost:{port}{stmt.endpoint}")')
-        self.main_code.append(f'log.Fatal(http.ListenAndServe(":{port}", nil))')
\ No newline at end of file
+        self.main_code.extend((
+            f"// Start HTTP server for {stmt.method.upper()} {stmt.endpoint}",
+            f'http.HandleFunc("{stmt.endpoint}", {handler_name})',
+            f'fmt.Println("Server starting on http://localhost:{port}{stmt.endpoint}")',
+            f'log.Fatal(http.ListenAndServe(":{port}", nil))',
+        ))
\ No newline at end of file
@@ -1,6 +1,7 @@
 """HTML code generator for Roelang frontend DSL."""
 
-from typing import List, Dict, Any, Set
+from collections import defaultdict
+from typing import List, Dict, Any, Set, Iterable, Iterator, Tuple
 from ...ast import (
     ASTNode, Program, DisplayStatement, IfStatement,
     Literal, Identifier, BinaryOp, PropertyAccess,
@@ -20,6 +21,194 @@ from ...symbols import SymbolTable, VariableType
 from ...codegen_base import BaseCodeGenerator, CodeGenError
 
 
+# Fixed start of every HTML document, up to the opening body tag
+_HTML_HEAD = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Roelang Web App</title>{styles}
+  <script src="assets/main.js"></script>{fonts}
+</head>
+<body>"""
+
+# Fixed end of every HTML document
+_HTML_TAIL = "</body>\n</html>"
+
+# Markup for each type of included asset, starting on a new line. CSS links
+# and font rules go in the document head, scripts at the end of the body.
+_ASSET_MARKUP = {
+    'css': '\n  <link rel="stylesheet" href="{path}">',
+    'font': """
+    @font-face {{
+      font-family: "{name}";
+      src: url("{path}");
+    }}""",
+    'js': '\n<script src="{path}"></script>',
+}
+
+# Link to the shared stylesheet used when CSS is not inlined
+_GLOBAL_CSS_LINK = '\n  <link rel="stylesheet" href="assets/global.css">'
+
+
+def _indented(block: str, indent: str) -> str:
+    """Prefix every line of a block, including blank ones, with an indent."""
+    return indent + block.replace('\n', '\n' + indent)
+
+
+# Replacements for characters that are special in HTML text and attributes
+_HTML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+# HTML tag for each layout type
+_LAYOUT_TAGS = {
+    'header': 'header',
+    'main': 'main',
+    'footer': 'footer',
+    'nav': 'nav',
+    'section': 'section',
+    'article': 'article',
+    'aside': 'aside',
+    'column': 'div',
+    'row': 'div',
+    'grid': 'div',
+    'stack': 'div',
+    'overlay': 'div'
+}
+
+# Semantic HTML tag for fragment names containing a keyword, in the order
+# the keywords are tried
+_FRAGMENT_TAGS = (
+    ('header', 'header'),
+    ('footer', 'footer'),
+    ('nav', 'nav'),
+    ('navigation', 'nav'),
+    ('main', 'main'),
+    ('content', 'main'),
+    ('sidebar', 'aside'),
+    ('aside', 'aside'),
+    ('article', 'article'),
+    ('section', 'section')
+)
+
+# Stylesheet inlined into standalone HTML documents
+_BASE_CSS = """\
+* {
+  box-sizing: border-box;
+  margin: 0;
+  padding: 0;
+}
+
+body {
+  font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+  line-height: 1.6;
+  color: #333;
+  background-color: #f5f5f5;
+}
+
+.layout-column {
+  display: flex;
+  flex-direction: column;
+  gap: 1rem;
+}
+
+.layout-row {
+  display: flex;
+  flex-direction: row;
+  gap: 1rem;
+  align-items: center;
+}
+
+.layout-grid {
+  display: grid;
+  gap: 1rem;
+  grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+}
+
+.layout-stack {
+  position: relative;
+}
+
+.layout-overlay {
+  position: fixed;
+  top: 0;
+  left: 0;
+  width: 100%;
+  height: 100%;
+  background-color: rgba(0, 0, 0, 0.5);
+  display: flex;
+  align-items: center;
+  justify-content: center;
+}
+
+.form-container {
+  background: white;
+  padding: 2rem;
+  border-radius: 8px;
+  box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
+  max-width: 400px;
+  width: 100%;
+}
+
+.title {
+  font-size: 1.5rem;
+  font-weight: 600;
+  margin-bottom: 1rem;
+  text-align: center;
+}
+
+.input-field, .textarea-field {
+  width: 100%;
+  padding: 0.75rem;
+  border: 1px solid #ddd;
+  border-radius: 4px;
+  font-size: 1rem;
+  transition: border-color 0.2s;
+}
+
+.input-field:focus, .textarea-field:focus {
+  outline: none;
+  border-color: #007bff;
+  box-shadow: 0 0 0 2px rgba(0, 123, 255, 0.25);
+}
+
+.button {
+  background-color: #007bff;
+  color: white;
+  border: none;
+  padding: 0.75rem 1.5rem;
+  border-radius: 4px;
+  font-size: 1rem;
+  cursor: pointer;
+  transition: background-color 0.2s;
+  width: 100%;
+}
+
+.button:hover {
+  background-color: #0056b3;
+}
+
+.error {
+  color: #dc3545;
+  font-size: 0.875rem;
+  margin-top: 0.25rem;
+}
+
+.input-error {
+  border-color: #dc3545 !important;
+  box-shadow: 0 0 0 2px rgba(220, 53, 69, 0.25) !important;
+}"""
+
+# Style element holding the stylesheet, for documents that inline their CSS
+_INLINE_STYLE = f"\n  <style>\n{_indented(_BASE_CSS, '    ')}\n  </style>"
+
+
 class HTMLCodeGenerator(BaseCodeGenerator):
     """Generates HTML/CSS/JavaScript code from Roelang frontend DSL."""
     
@@ -31,11 +220,52 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         self.screens: Dict[str, ScreenDefinition] = {}
         self.forms: Dict[str, FormDefinition] = {}
         self.component_counter = 0
+        # Layout and screen numbers keep counting across generate() calls
+        self.layout_counter = 0
+        self.screen_counter = 0
         self.validation_rules: Set[str] = set()
         self.bindings: Dict[str, str] = {}  # component_id -> binding_target
-        self.asset_includes: List[AssetInclude] = []  # Track included assets
+        # Track included assets, grouped by asset type
+        self.assets_by_type: Dict[str, List[AssetInclude]] = defaultdict(list)
         self.use_external_css = True  # Flag to use external CSS
         
+        # Collector for each top-level definition class, and the variant
+        # used inside modules, where screens also register their forms and
+        # nested modules are not descended into
+        self._module_collectors = {
+            AssetInclude: self._collect_asset,
+            DataDefinition: self._collect_data_model,
+            ActionDefinitionWithParams: self._collect_action,
+            ActionDefinition: self._collect_plain_action,
+            FragmentDefinition: self._collect_fragment,
+            ScreenDefinition: self._collect_module_screen,
+            FormDefinition: self._collect_form,
+        }
+        self._definition_collectors = {
+            **self._module_collectors,
+            ScreenDefinition: self._collect_screen,
+            ModuleDefinition: self._collect_module,
+        }
+        
+        # Generator for each UI component class, looked up by exact type
+        self._component_generators = {
+            LayoutDefinition: self.generate_layout,
+            FormDefinition: self.generate_form,
+            TitleComponent: self.generate_title,
+            TextComponent: self.generate_text,
+            InputComponent: self.generate_input,
+            TextareaComponent: self.generate_textarea,
+            DropdownComponent: self.generate_dropdown,
+            ToggleComponent: self.generate_toggle,
+            CheckboxComponent: self.generate_checkbox,
+            RadioComponent: self.generate_radio,
+            ButtonComponent: self.generate_button,
+            ImageComponent: self.generate_image,
+            VideoComponent: self.generate_video,
+            AudioComponent: self.generate_audio,
+            SlotComponent: self.generate_slot,
+        }
+        
     def generate(self, program: Program) -> str:
         """Generate complete HTML application from AST."""
         self.clear_output()
@@ -50,62 +280,64 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         
         
         # First pass: collect data models, actions, layouts, and assets
-        for stmt in program.statements:
-            if isinstance(stmt, AssetInclude):
-                self.asset_includes.append(stmt)
-            elif isinstance(stmt, DataDefinition):
-                self.data_models[stmt.name] = stmt
-            elif isinstance(stmt, ActionDefinitionWithParams):
-                self.actions[stmt.name] = stmt
-            elif isinstance(stmt, ActionDefinition):
-                # Convert ActionDefinition to ActionDefinitionWithParams for consistency
-                action_with_params = ActionDefinitionWithParams(
-                    name=stmt.name,
-                    parameters=[],
-                    body=stmt.body,
-                    return_type=getattr(stmt, 'return_type', None)
-                )
-                self.actions[stmt.name] = action_with_params
-            elif isinstance(stmt, FragmentDefinition):
-                self.fragments[stmt.name] = stmt
-            elif isinstance(stmt, ScreenDefinition):
-                self.screens[stmt.name] = stmt
-            elif isinstance(stmt, FormDefinition):
-                self.forms[stmt.name] = stmt
-            elif isinstance(stmt, ModuleDefinition):
-                # Process module contents
-                for module_stmt in stmt.body:
-                    if isinstance(module_stmt, AssetInclude):
-                        self.asset_includes.append(module_stmt)
-                    elif isinstance(module_stmt, DataDefinition):
-                        self.data_models[module_stmt.name] = module_stmt
-                    elif isinstance(module_stmt, ActionDefinitionWithParams):
-                        self.actions[module_stmt.name] = module_stmt
-                    elif isinstance(module_stmt, ActionDefinition):
-                        # Convert ActionDefinition to ActionDefinitionWithParams for consistency
-                        action_with_params = ActionDefinitionWithParams(
-                            name=module_stmt.name,
-                            parameters=[],
-                            body=module_stmt.body,
-                            return_type=getattr(module_stmt, 'return_type', None)
-                        )
-                        self.actions[module_stmt.name] = action_with_params
-                    elif isinstance(module_stmt, FragmentDefinition):
-                        self.fragments[module_stmt.name] = module_stmt
-                    elif isinstance(module_stmt, ScreenDefinition):
-                        self.screens[module_stmt.name] = module_stmt
-                        # Recursively collect forms from screen children
-                        self._collect_forms_from_children(module_stmt.children)
-                    elif isinstance(module_stmt, FormDefinition):
-                        self.forms[module_stmt.name] = module_stmt
-        
-        
+        self._collect_definitions(program.statements, self._definition_collectors)
         
         # Generate HTML document
         html_content = self.generate_html_document(program)
         
         return html_content
     
+    def _collect_definitions(self, statements: List[ASTNode], collectors: Dict[type, Any]):
+        """Hand each statement to the collector registered for its type."""
+        for stmt in statements:
+            collector = collectors.get(type(stmt))
+            if collector is not None:
+                collector(stmt)
+    
+    def _collect_asset(self, stmt: AssetInclude):
+        """Register an included asset under its type."""
+        self.assets_by_type[stmt.asset_type].append(stmt)
+    
+    def _collect_data_model(self, stmt: DataDefinition):
+        """Register a data model."""
+        self.data_models[stmt.name] = stmt
+    
+    def _collect_action(self, stmt: ActionDefinitionWithParams):
+        """Register an action with parameters."""
+        self.actions[stmt.name] = stmt
+    
+    def _collect_plain_action(self, stmt: ActionDefinition):
+        """Register an action without parameters."""
+        # Convert ActionDefinition to ActionDefinitionWithParams for consistency
+        self.actions[stmt.name] = ActionDefinitionWithParams(
+            name=stmt.name,
+            parameters=[],
+            body=stmt.body,
+            return_type=getattr(stmt, 'return_type', None)
+        )
+    
+    def _collect_fragment(self, stmt: FragmentDefinition):
+        """Register a fragment."""
+        self.fragments[stmt.name] = stmt
+    
+    def _collect_screen(self, stmt: ScreenDefinition):
+        """Register a top-level screen."""
+        self.screens[stmt.name] = stmt
+    
+    def _collect_module_screen(self, stmt: ScreenDefinition):
+        """Register a screen declared inside a module."""
+        self.screens[stmt.name] = stmt
+        # Recursively collect forms from screen children
+        self._collect_forms_from_children(stmt.children)
+    
+    def _collect_form(self, stmt: FormDefinition):
+        """Register a form."""
+        self.forms[stmt.name] = stmt
+    
+    def _collect_module(self, stmt: ModuleDefinition):
+        """Register the definitions inside a module."""
+        self._collect_definitions(stmt.body, self._module_collectors)
+    
     def _collect_forms_from_children(self, children):
         """Recursively collect forms from layout children."""
         for child in children:
@@ -117,55 +349,21 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_html_document(self, program: Program) -> str:
         """Generate complete HTML document."""
-        self.emit("<!DOCTYPE html>")
-        self.emit("<html lang=\"en\">")
-        self.emit("<head>")
-        self.indent_level += 1
-        self.emit("<meta charset=\"UTF-8\">")
-        self.emit("<meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">")
-        self.emit("<title>Roelang Web App</title>")
-        
         # Include external CSS files
-        css_includes = [asset for asset in self.asset_includes if asset.asset_type == 'css']
-        if css_includes or self.use_external_css:
+        css_links = self._asset_markup('css')
+        if css_links or self.use_external_css:
             # Always include global.css if using external CSS
-            if self.use_external_css:
-                self.emit('<link rel="stylesheet" href="assets/global.css">')
-            
-            # Include any additional CSS files
-            for asset in css_includes:
-                self.emit(f'<link rel="stylesheet" href="{asset.asset_path}">')
-        
+            styles = (_GLOBAL_CSS_LINK if self.use_external_css else "") + css_links
         else:
             # Inline CSS for standalone HTML
-            self.emit("<style>")
-            self.indent_level += 1
-            self.generate_css()
-            self.indent_level -= 1
-            self.emit("</style>")
-        
-        # Always include main.js for HTML target
-        self.emit('<script src="assets/main.js"></script>')
+            styles = _INLINE_STYLE
         
         # Include external fonts
-        font_includes = [asset for asset in self.asset_includes if asset.asset_type == 'font']
-        if font_includes:
-            self.emit("<style>")
-            self.indent_level += 1
-            for asset in font_includes:
-                font_name = asset.asset_path.split('/')[-1].split('.')[0]
-                self.emit(f"@font-face {{")
-                self.indent_level += 1
-                self.emit(f'font-family: "{font_name}";')
-                self.emit(f'src: url("{asset.asset_path}");')
-                self.indent_level -= 1
-                self.emit("}")
-            self.indent_level -= 1
-            self.emit("</style>")
-        self.indent_level -= 1
-        self.emit("</head>")
+        font_faces = self._asset_markup('font')
+        fonts = f"\n  <style>{font_faces}\n  </style>" if font_faces else ""
         
-        self.emit("<body>")
+        # The fixed document head is emitted as one block
+        self._emit_block(_HTML_HEAD.format_map({'styles': styles, 'fonts': fonts}))
         self.indent_level += 1
         
         
@@ -184,9 +382,9 @@ class HTMLCodeGenerator(BaseCodeGenerator):
             self.generate_form(form_def)
         
         # Include external JavaScript files
-        js_includes = [asset for asset in self.asset_includes if asset.asset_type == 'js']
-        for asset in js_includes:
-            self.emit(f'<script src="{asset.asset_path}"></script>')
+        scripts = self._asset_markup('js')
+        if scripts:
+            self._emit_block(scripts[1:])
         
         # Generate inline JavaScript
         self.emit("<script>")
@@ -196,177 +394,43 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         self.emit("</script>")
         
         self.indent_level -= 1
-        self.emit("</body>")
-        self.emit("</html>")
+        self._emit_block(_HTML_TAIL)
         
         return self.get_output()
     
     def generate_css(self):
         """Generate CSS styles for the web application."""
-        # Base styles
-        self.emit("* {")
-        self.indent_level += 1
-        self.emit("box-sizing: border-box;")
-        self.emit("margin: 0;")
-        self.emit("padding: 0;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit("body {")
-        self.indent_level += 1
-        self.emit("font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;")
-        self.emit("line-height: 1.6;")
-        self.emit("color: #333;")
-        self.emit("background-color: #f5f5f5;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        # Layout styles
-        self.emit(".layout-column {")
-        self.indent_level += 1
-        self.emit("display: flex;")
-        self.emit("flex-direction: column;")
-        self.emit("gap: 1rem;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".layout-row {")
-        self.indent_level += 1
-        self.emit("display: flex;")
-        self.emit("flex-direction: row;")
-        self.emit("gap: 1rem;")
-        self.emit("align-items: center;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".layout-grid {")
-        self.indent_level += 1
-        self.emit("display: grid;")
-        self.emit("gap: 1rem;")
-        self.emit("grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".layout-stack {")
-        self.indent_level += 1
-        self.emit("position: relative;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".layout-overlay {")
-        self.indent_level += 1
-        self.emit("position: fixed;")
-        self.emit("top: 0;")
-        self.emit("left: 0;")
-        self.emit("width: 100%;")
-        self.emit("height: 100%;")
-        self.emit("background-color: rgba(0, 0, 0, 0.5);")
-        self.emit("display: flex;")
-        self.emit("align-items: center;")
-        self.emit("justify-content: center;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        # Component styles
-        self.emit(".form-container {")
-        self.indent_level += 1
-        self.emit("background: white;")
-        self.emit("padding: 2rem;")
-        self.emit("border-radius: 8px;")
-        self.emit("box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);")
-        self.emit("max-width: 400px;")
-        self.emit("width: 100%;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".title {")
-        self.indent_level += 1
-        self.emit("font-size: 1.5rem;")
-        self.emit("font-weight: 600;")
-        self.emit("margin-bottom: 1rem;")
-        self.emit("text-align: center;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".input-field, .textarea-field {")
-        self.indent_level += 1
-        self.emit("width: 100%;")
-        self.emit("padding: 0.75rem;")
-        self.emit("border: 1px solid #ddd;")
-        self.emit("border-radius: 4px;")
-        self.emit("font-size: 1rem;")
-        self.emit("transition: border-color 0.2s;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".input-field:focus, .textarea-field:focus {")
-        self.indent_level += 1
-        self.emit("outline: none;")
-        self.emit("border-color: #007bff;")
-        self.emit("box-shadow: 0 0 0 2px rgba(0, 123, 255, 0.25);")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".button {")
-        self.indent_level += 1
-        self.emit("background-color: #007bff;")
-        self.emit("color: white;")
-        self.emit("border: none;")
-        self.emit("padding: 0.75rem 1.5rem;")
-        self.emit("border-radius: 4px;")
-        self.emit("font-size: 1rem;")
-        self.emit("cursor: pointer;")
-        self.emit("transition: background-color 0.2s;")
-        self.emit("width: 100%;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".button:hover {")
-        self.indent_level += 1
-        self.emit("background-color: #0056b3;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        self.emit(".error {")
-        self.indent_level += 1
-        self.emit("color: #dc3545;")
-        self.emit("font-size: 0.875rem;")
-        self.emit("margin-top: 0.25rem;")
-        self.indent_level -= 1
-        self.emit("}")
-        self.emit("")
-        
-        # Validation styles
-        self.emit(".input-error {")
-        self.indent_level += 1
-        self.emit("border-color: #dc3545 !important;")
-        self.emit("box-shadow: 0 0 0 2px rgba(220, 53, 69, 0.25) !important;")
-        self.indent_level -= 1
-        self.emit("}")
+        # The stylesheet is static, so it is added as one block at the
+        # current indentation instead of being emitted line by line
+        self._emit_block(_BASE_CSS)
+    
+    def _asset_markup(self, asset_type: str) -> str:
+        """Render the markup for every included asset of one type."""
+        template = _ASSET_MARKUP[asset_type]
+        return ''.join(
+            template.format_map({'path': asset.asset_path,
+                                 'name': asset.asset_path.split('/')[-1].split('.')[0]})
+            for asset in self.assets_by_type[asset_type]
+        )
+    
+    def _emit_block(self, block: str):
+        """Emit a multi-line block of code at the current indentation."""
+        self.emit(block.replace('\n', '\n' + self._indent))
+    
+    def _emit_lines(self, lines: Iterable[str]):
+        """Emit generated lines as one block at the current indentation."""
+        lines = list(lines)
+        if lines:
+            self._emit_block('\n'.join(lines))
     
     def generate_layout(self, layout: LayoutDefinition):
         """Generate HTML for a layout definition."""
         # Generate unique ID
-        if not hasattr(self, 'layout_counter'):
-            self.layout_counter = 0
         self.layout_counter += 1
         layout_id = f"layout-{layout.name}-{self.layout_counter}"
         
         # Only use explicitly declared CSS classes
-        classes = layout.css_classes if hasattr(layout, 'css_classes') and layout.css_classes else []
+        classes = getattr(layout, 'css_classes', None) or []
         
         # Build attributes - only add class attribute if there are explicit classes
         attrs = [f'id="{layout_id}"']
@@ -374,8 +438,9 @@ class HTMLCodeGenerator(BaseCodeGenerator):
             attrs.append(f'class="{" ".join(classes)}"')
         
         # Add style if present
-        if hasattr(layout, 'style') and layout.style:
-            attrs.append(f'style="{self.escape_html(layout.style)}"')
+        style = getattr(layout, 'style', None)
+        if style:
+            attrs.append(f'style="{self.escape_html(style)}"')
         
         # Choose appropriate HTML tag based on layout type
         html_tag = self.get_html_tag_for_layout(layout)
@@ -390,44 +455,40 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         self.emit(f"</{html_tag}>")
         self.emit("")
     
+    def _fmt_attrs(self, component: ASTNode, attrs=()) -> str:
+        """Format the given attributes followed by the component's classes and styles.
+        
+        The result starts with a space so it can follow the tag name directly,
+        and is empty if there are no attributes at all.
+        """
+        parts = list(attrs)
+        classes = getattr(component, 'classes', None)
+        if classes:
+            parts.append(f'class="{" ".join(classes)}"')
+        styles = getattr(component, 'styles', None)
+        if styles:
+            parts.append(f'style="{styles}"')
+        return ' ' + ' '.join(parts) if parts else ''
+    
+    def _next_component_id(self, prefix: str) -> str:
+        """Advance the component counter and return a unique element ID."""
+        self.component_counter += 1
+        return f"{prefix}-{self.component_counter}"
+    
     def get_html_tag_for_layout(self, layout: LayoutDefinition) -> str:
         """Get appropriate HTML tag for a layout based on its type."""
-        layout_type = getattr(layout, 'layout_type', 'div')
-        
-        # Map layout types to HTML tags
-        tag_mapping = {
-            'header': 'header',
-            'main': 'main', 
-            'footer': 'footer',
-            'nav': 'nav',
-            'section': 'section',
-            'article': 'article',
-            'aside': 'aside',
-            'column': 'div',
-            'row': 'div',
-            'grid': 'div',
-            'stack': 'div',
-            'overlay': 'div'
-        }
-        
-        return tag_mapping.get(layout_type, 'div')
+        return _LAYOUT_TAGS.get(getattr(layout, 'layout_type', 'div'), 'div')
     
     def generate_screen(self, screen: ScreenDefinition):
         """Generate HTML for a screen definition using fragments."""
         # Generate unique ID for the screen
-        if not hasattr(self, 'screen_counter'):
-            self.screen_counter = 0
         self.screen_counter += 1
         screen_id = f"screen-{screen.name}-{self.screen_counter}"
         
         # Build screen container attributes
-        attrs = [f'id="{screen_id}"']
-        if hasattr(screen, 'classes') and screen.classes:
-            attrs.append(f'class="{" ".join(screen.classes)}"')
-        if hasattr(screen, 'styles') and screen.styles:
-            attrs.append(f'style="{screen.styles}"')
+        attrs = self._fmt_attrs(screen, (f'id="{screen_id}"',))
         
-        self.emit(f'<div {" ".join(attrs)}>')
+        self.emit(f'<div{attrs}>')
         self.indent()
         
         # Process each fragment reference in the screen
@@ -450,16 +511,12 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         self.component_counter += 1
         
         # Build fragment container attributes
-        attrs = [f'id="{fragment_id}"', f'data-fragment="{fragment.name}"']
-        if hasattr(fragment, 'classes') and fragment.classes:
-            attrs.append(f'class="{" ".join(fragment.classes)}"')
-        if hasattr(fragment, 'styles') and fragment.styles:
-            attrs.append(f'style="{fragment.styles}"')
+        attrs = self._fmt_attrs(fragment, (f'id="{fragment_id}"', f'data-fragment="{fragment.name}"'))
         
         # Use semantic tag based on fragment name or default to div
         tag = self.get_semantic_tag_for_fragment(fragment.name)
         
-        self.emit(f'<{tag} {" ".join(attrs)}>')
+        self.emit(f'<{tag}{attrs}>')
         self.indent()
         
         # Generate content for each slot in the fragment
@@ -471,22 +528,10 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def get_semantic_tag_for_fragment(self, fragment_name: str) -> str:
         """Get appropriate semantic HTML tag based on fragment name."""
-        semantic_mapping = {
-            'header': 'header',
-            'footer': 'footer', 
-            'nav': 'nav',
-            'navigation': 'nav',
-            'main': 'main',
-            'content': 'main',
-            'sidebar': 'aside',
-            'aside': 'aside',
-            'article': 'article',
-            'section': 'section'
-        }
-        
         # Check for partial matches
-        for keyword, tag in semantic_mapping.items():
-            if keyword in fragment_name.lower():
+        name = fragment_name.lower()
+        for keyword, tag in _FRAGMENT_TAGS:
+            if keyword in name:
                 return tag
         
         return 'div'  # Default fallback
@@ -497,13 +542,9 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         self.component_counter += 1
         
         # Build slot attributes
-        attrs = [f'id="{slot_id}"', f'data-slot="{slot.name}"']
-        if hasattr(slot, 'classes') and slot.classes:
-            attrs.append(f'class="{" ".join(slot.classes)}"')
-        if hasattr(slot, 'styles') and slot.styles:
-            attrs.append(f'style="{slot.styles}"')
+        attrs = self._fmt_attrs(slot, (f'id="{slot_id}"', f'data-slot="{slot.name}"'))
         
-        self.emit(f'<div {" ".join(attrs)}>')
+        self.emit(f'<div{attrs}>')
         self.indent()
         
         # Generate content assigned to this slot, or default content if no assignment
@@ -520,8 +561,6 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     def generate_screen_with_layout(self, screen: ScreenDefinition, layout: LayoutDefinition):
         """Generate screen content within a layout, filling slots appropriately."""
         # Generate unique ID for the screen
-        if not hasattr(self, 'screen_counter'):
-            self.screen_counter = 0
         self.screen_counter += 1
         screen_id = f"screen-{screen.name}-{self.screen_counter}"
         
@@ -529,7 +568,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         layout_id = f"layout-{layout.name}-{self.screen_counter}"
         
         # Only use explicitly declared CSS classes
-        classes = layout.css_classes if hasattr(layout, 'css_classes') and layout.css_classes else []
+        classes = getattr(layout, 'css_classes', None) or []
         
         # Build attributes
         attrs = [f'id="{layout_id}"']
@@ -573,13 +612,11 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     def generate_layout_with_slot_filling(self, layout: LayoutDefinition, screen: ScreenDefinition):
         """Generate a layout container but process its children for slot filling."""
         # Generate unique ID
-        if not hasattr(self, 'layout_counter'):
-            self.layout_counter = 0
         self.layout_counter += 1
         layout_id = f"layout-{layout.name}-{self.layout_counter}"
         
         # Only use explicitly declared CSS classes
-        classes = layout.css_classes if hasattr(layout, 'css_classes') and layout.css_classes else []
+        classes = getattr(layout, 'css_classes', None) or []
         
         # Build attributes - only add class attribute if there are explicit classes
         attrs = [f'id="{layout_id}"']
@@ -587,8 +624,9 @@ class HTMLCodeGenerator(BaseCodeGenerator):
             attrs.append(f'class="{" ".join(classes)}"')
         
         # Add style if present
-        if hasattr(layout, 'style') and layout.style:
-            attrs.append(f'style="{self.escape_html(layout.style)}"')
+        style = getattr(layout, 'style', None)
+        if style:
+            attrs.append(f'style="{self.escape_html(style)}"')
         
         # Choose appropriate HTML tag based on layout type
         html_tag = self.get_html_tag_for_layout(layout)
@@ -607,13 +645,11 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     def generate_screen_standalone(self, screen: ScreenDefinition):
         """Generate screen without a layout."""
         # Generate unique ID
-        if not hasattr(self, 'screen_counter'):
-            self.screen_counter = 0
         self.screen_counter += 1
         screen_id = f"screen-{screen.name}-{self.screen_counter}"
         
         # Build attributes
-        classes = screen.css_classes if hasattr(screen, 'css_classes') and screen.css_classes else []
+        classes = getattr(screen, 'css_classes', None) or []
         attrs = [f'id="{screen_id}"']
         if classes:
             attrs.append(f'class="{" ".join(classes)}"')
@@ -649,83 +685,28 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_component(self, component: ASTNode):
         """Generate HTML for a UI component."""
-        if isinstance(component, LayoutDefinition):
-            self.generate_layout(component)
-        elif isinstance(component, FormDefinition):
-            self.generate_form(component)
-        elif isinstance(component, TitleComponent):
-            self.generate_title(component)
-        elif isinstance(component, TextComponent):
-            self.generate_text(component)
-        elif isinstance(component, InputComponent):
-            self.generate_input(component)
-        elif isinstance(component, TextareaComponent):
-            self.generate_textarea(component)
-        elif isinstance(component, DropdownComponent):
-            self.generate_dropdown(component)
-        elif isinstance(component, ToggleComponent):
-            self.generate_toggle(component)
-        elif isinstance(component, CheckboxComponent):
-            self.generate_checkbox(component)
-        elif isinstance(component, RadioComponent):
-            self.generate_radio(component)
-        elif isinstance(component, ButtonComponent):
-            self.generate_button(component)
-        elif isinstance(component, ImageComponent):
-            self.generate_image(component)
-        elif isinstance(component, VideoComponent):
-            self.generate_video(component)
-        elif isinstance(component, AudioComponent):
-            self.generate_audio(component)
-        elif isinstance(component, SlotComponent):
-            self.generate_slot(component)
+        generator = self._component_generators.get(type(component))
+        if generator is not None:
+            generator(component)
     
     def generate_title(self, title: TitleComponent):
         """Generate HTML for title component."""
-        # Build attributes
-        attrs = []
-        
-        # Add classes if present
-        if hasattr(title, 'classes') and title.classes:
-            attrs.append(f'class="{" ".join(title.classes)}"')
-        
-        # Add styles if present
-        if hasattr(title, 'styles') and title.styles:
-            attrs.append(f'style="{title.styles}"')
-        
-        # Generate with attributes if any, or plain if none
-        if attrs:
-            self.emit(f'<h2 {" ".join(attrs)}>{self.escape_html(title.text)}</h2>')
-        else:
-            self.emit(f'<h2>{self.escape_html(title.text)}</h2>')
+        # Classes and styles are only added if present
+        attrs = self._fmt_attrs(title)
+        self.emit(f'<h2{attrs}>{self.escape_html(title.text)}</h2>')
     
     def generate_text(self, text: TextComponent):
         """Generate HTML for text component."""
-        # Build attributes
-        attrs = []
-        
-        # Add classes if present
-        if hasattr(text, 'classes') and text.classes:
-            attrs.append(f'class="{" ".join(text.classes)}"')
-        
-        # Add styles if present
-        if hasattr(text, 'styles') and text.styles:
-            attrs.append(f'style="{text.styles}"')
-        
-        # Generate with attributes if any, or plain if none
-        if attrs:
-            self.emit(f'<p {" ".join(attrs)}>{self.escape_html(text.text)}</p>')
-        else:
-            self.emit(f'<p>{self.escape_html(text.text)}</p>')
+        # Classes and styles are only added if present
+        attrs = self._fmt_attrs(text)
+        self.emit(f'<p{attrs}>{self.escape_html(text.text)}</p>')
     
     def generate_input(self, input_comp: InputComponent):
         """Generate HTML for input component."""
         # Use element_id if provided, otherwise generate one
-        if hasattr(input_comp, 'element_id') and input_comp.element_id:
-            input_id = input_comp.element_id
-        else:
-            self.component_counter += 1
-            input_id = f"input-{self.component_counter}"
+        input_id = getattr(input_comp, 'element_id', None)
+        if not input_id:
+            input_id = self._next_component_id('input')
         
         # Store binding if present
         if input_comp.binding:
@@ -800,16 +781,15 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_textarea(self, textarea: TextareaComponent):
         """Generate HTML for textarea component."""
-        self.component_counter += 1
-        textarea_id = f"textarea-{self.component_counter}"
+        textarea_id = self._next_component_id('textarea')
         
         if textarea.binding:
             self.bindings[textarea_id] = textarea.binding
         
         # Get attributes from the new fields and attributes
-        rows = textarea.rows if hasattr(textarea, 'rows') and textarea.rows else 4
-        placeholder = textarea.placeholder if hasattr(textarea, 'placeholder') and textarea.placeholder else ""
-        label = textarea.label if hasattr(textarea, 'label') and textarea.label else ""
+        rows = getattr(textarea, 'rows', None) or 4
+        placeholder = getattr(textarea, 'placeholder', None) or ""
+        label = getattr(textarea, 'label', None) or ""
         name = textarea_id  # Default name to id
         required = False
         disabled = False
@@ -869,17 +849,15 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     def generate_dropdown(self, dropdown: DropdownComponent):
         """Generate HTML for dropdown component."""
         # Use element_id if provided, otherwise generate one
-        if hasattr(dropdown, 'element_id') and dropdown.element_id:
-            select_id = dropdown.element_id
-        else:
-            self.component_counter += 1
-            select_id = f"select-{self.component_counter}"
+        select_id = getattr(dropdown, 'element_id', None)
+        if not select_id:
+            select_id = self._next_component_id('select')
         
         if dropdown.binding:
             self.bindings[select_id] = dropdown.binding
         
         # Get attributes from the new fields and attributes
-        label = dropdown.label if hasattr(dropdown, 'label') and dropdown.label else ""
+        label = getattr(dropdown, 'label', None) or ""
         name = select_id  # Default name to id
         required = False
         disabled = False
@@ -927,9 +905,10 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         self.indent_level += 1
         
         # Handle both old structure (Literal objects) and new structure (string list)
-        if hasattr(dropdown, 'options') and dropdown.options:
-            if isinstance(dropdown.options, list):
-                for option in dropdown.options:
+        options = getattr(dropdown, 'options', None)
+        if options:
+            if isinstance(options, list):
+                for option in options:
                     if isinstance(option, str):
                         # New format: simple string options
                         value = self.escape_html(option)
@@ -947,8 +926,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_toggle(self, toggle: ToggleComponent):
         """Generate HTML for toggle component."""
-        self.component_counter += 1
-        toggle_id = f"toggle-{self.component_counter}"
+        toggle_id = self._next_component_id('toggle')
         
         if toggle.binding:
             self.bindings[toggle_id] = toggle.binding
@@ -963,11 +941,9 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     def generate_checkbox(self, checkbox: CheckboxComponent):
         """Generate HTML for checkbox component."""
         # Use element_id if provided, otherwise generate one
-        if hasattr(checkbox, 'element_id') and checkbox.element_id:
-            checkbox_id = checkbox.element_id
-        else:
-            self.component_counter += 1
-            checkbox_id = f"checkbox-{self.component_counter}"
+        checkbox_id = getattr(checkbox, 'element_id', None)
+        if not checkbox_id:
+            checkbox_id = self._next_component_id('checkbox')
         
         if checkbox.binding:
             self.bindings[checkbox_id] = checkbox.binding
@@ -983,11 +959,9 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     def generate_radio(self, radio: RadioComponent):
         """Generate HTML for radio component."""
         # Use element_id if provided, otherwise generate one
-        if hasattr(radio, 'element_id') and radio.element_id:
-            radio_id = radio.element_id
-        else:
-            self.component_counter += 1
-            radio_id = f"radio-{self.component_counter}"
+        radio_id = getattr(radio, 'element_id', None)
+        if not radio_id:
+            radio_id = self._next_component_id('radio')
         
         # Use binding as radio group name if available
         group_name = radio.binding or "radio-group"
@@ -1014,8 +988,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_button(self, button: ButtonComponent):
         """Generate HTML for button component."""
-        self.component_counter += 1
-        button_id = f"button-{self.component_counter}"
+        button_id = self._next_component_id('button')
         
         button_attrs = [
             f'id="{button_id}"',
@@ -1031,7 +1004,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
             
             if button.action in self.actions:
                 action_def = self.actions[button.action]
-                if hasattr(action_def, 'parameters') and action_def.parameters:
+                if getattr(action_def, 'parameters', None):
                     action_needs_form_data = True
             
             # Also check if action name suggests form submission
@@ -1057,8 +1030,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_image(self, image: ImageComponent):
         """Generate HTML for image component."""
-        self.component_counter += 1
-        image_id = f"image-{self.component_counter}"
+        image_id = self._next_component_id('image')
         
         img_attrs = [
             f'id="{image_id}"',
@@ -1079,8 +1051,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_video(self, video: VideoComponent):
         """Generate HTML for video component."""
-        self.component_counter += 1
-        video_id = f"video-{self.component_counter}"
+        video_id = self._next_component_id('video')
         
         video_attrs = [
             f'id="{video_id}"',
@@ -1107,8 +1078,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_audio(self, audio: AudioComponent):
         """Generate HTML for audio component."""
-        self.component_counter += 1
-        audio_id = f"audio-{self.component_counter}"
+        audio_id = self._next_component_id('audio')
         
         audio_attrs = [
             f'id="{audio_id}"',
@@ -1134,8 +1104,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     def generate_slot(self, slot: SlotComponent):
         """Generate HTML for slot component - renders default content."""
         # Generate unique ID
-        self.component_counter += 1
-        slot_id = f"slot-{slot.name}-{self.component_counter}"
+        slot_id = self._next_component_id(f"slot-{slot.name}")
         
         # Build attributes
         classes = slot.css_classes if slot.css_classes else []
@@ -1176,7 +1145,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         
         # Create model instances with storage support
         for name, data_def in self.data_models.items():
-            storage_type = data_def.storage_type if hasattr(data_def, 'storage_type') else None
+            storage_type = getattr(data_def, 'storage_type', None)
             storage_arg = f"'{storage_type}'" if storage_type else "null"
             self.emit(f"Roelang.DataBinding.createModel('{name}', {name}, {storage_arg});")
         
@@ -1212,6 +1181,13 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def generate_form_handlers(self):
         """Generate form submission handlers."""
+        # Every form validates and collects the same bound fields, so the
+        # bindings are walked and resolved once rather than for each form
+        validation_rules = tuple(self._validation_rule_lines())
+        form_collection = tuple(self._field_collection_lines(
+            self._bound_model_fields(), ".value || '';",
+            separate=True, validate=False))
+        
         for form_name, form_def in self.forms.items():
             form_id = f"form-{form_name}"
             
@@ -1223,18 +1199,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
             # Generate validation rules object
             self.emit("const validationRules = {")
             self.indent_level += 1
-            
-            # Collect validation rules from components
-            for component_id, binding_target in self.bindings.items():
-                # Add basic validation rules
-                self.emit(f"'{component_id}': [")
-                self.indent_level += 1
-                self.emit("{ type: 'required', message: 'This field is required' },")
-                if 'email' in component_id.lower():
-                    self.emit("{ type: 'email', message: 'Please enter a valid email' }")
-                self.indent_level -= 1
-                self.emit("],")
-            
+            self._emit_lines(validation_rules)
             self.indent_level -= 1
             self.emit("};")
             self.emit("")
@@ -1245,30 +1210,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
             self.emit("")
             
             # Generate form data collection based on bindings
-            for element_id, binding_target in self.bindings.items():
-                if '.' in binding_target:
-                    model_name, field_name = binding_target.split('.', 1)
-                    if model_name in self.data_models:
-                        data_def = self.data_models[model_name]
-                        field = next((f for f in data_def.fields if f.name == field_name), None)
-                        
-                        if field:
-                            safe_element_var = element_id.replace('-', '_')
-                            self.emit(f"const {safe_element_var}Element = document.getElementById('{element_id}');")
-                            self.emit(f"if ({safe_element_var}Element) {{")
-                            self.indent_level += 1
-                            
-                            # Generate data collection based on field type
-                            if field.type.lower() == 'boolean':
-                                self.emit(f"formData.{field_name} = {safe_element_var}Element.checked;")
-                            elif field.type.lower() in ['number', 'int']:
-                                self.emit(f"formData.{field_name} = parseInt({safe_element_var}Element.value) || 0;")
-                            else:
-                                self.emit(f"formData.{field_name} = {safe_element_var}Element.value || '';")
-                            
-                            self.indent_level -= 1
-                            self.emit("}")
-                            self.emit("")
+            self._emit_lines(form_collection)
             
             # Display form data for verification
             self.emit("// Display form data for verification")
@@ -1410,6 +1352,12 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         
         self.emit("")
         
+        # Bindings are resolved to data model fields once, and every form
+        # collects the same fields
+        bound_fields = self._bound_model_fields()
+        form_collection = tuple(self._field_collection_lines(bound_fields, ".value;",
+                                                              separate=False, validate=True))
+        
         # Generate form-specific collection functions
         for form_name in self.forms.keys():
             self.emit(f"function collect{form_name.title()}Data() {{")
@@ -1419,37 +1367,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
             self.emit("")
             
             # Collect data from bindings
-            for element_id, binding_target in self.bindings.items():
-                if '.' in binding_target:
-                    model_name, field_name = binding_target.split('.', 1)
-                    if model_name in self.data_models:
-                        data_def = self.data_models[model_name]
-                        field = next((f for f in data_def.fields if f.name == field_name), None)
-                        
-                        if field:
-                            safe_element_var = element_id.replace('-', '_')
-                            self.emit(f"const {safe_element_var}Element = document.getElementById('{element_id}');")
-                            self.emit(f"if ({safe_element_var}Element) {{")
-                            self.indent_level += 1
-                            
-                            # Generate data collection based on field type
-                            if field.type.lower() == 'boolean':
-                                self.emit(f"formData.{field_name} = {safe_element_var}Element.checked;")
-                            elif field.type.lower() in ['number', 'int']:
-                                self.emit(f"formData.{field_name} = parseInt({safe_element_var}Element.value) || 0;")
-                            else:
-                                self.emit(f"formData.{field_name} = {safe_element_var}Element.value;")
-                            
-                            # Generate validation for this field
-                            self.emit(f"// Validate {field_name}")
-                            self.emit(f"if (!validate{field_name.title()}({safe_element_var}Element)) {{")
-                            self.indent_level += 1
-                            self.emit("isValid = false;")
-                            self.indent_level -= 1
-                            self.emit("}")
-                            
-                            self.indent_level -= 1
-                            self.emit("}")
+            self._emit_lines(form_collection)
             
             self.emit("")
             self.emit("return { data: formData, isValid: isValid };")
@@ -1458,34 +1376,31 @@ class HTMLCodeGenerator(BaseCodeGenerator):
             self.emit("")
         
         # Generate individual field validation functions
-        for element_id, binding_target in self.bindings.items():
-            if '.' in binding_target:
-                model_name, field_name = binding_target.split('.', 1)
-                if model_name in self.data_models:
-                    self.emit(f"function validate{field_name.title()}(element) {{")
-                    self.indent_level += 1
-                    self.emit("let isValid = true;")
-                    self.emit("")
-                    
-                    # Find validation rules for this element
-                    # This would be expanded to include specific validation logic
-                    self.emit("// Add validation logic here")
-                    self.emit("if (element.hasAttribute('required') && !element.value.trim()) {")
-                    self.indent_level += 1
-                    self.emit(f"showError('{element_id}', 'This field is required');")
-                    self.emit("isValid = false;")
-                    self.indent_level -= 1
-                    self.emit("} else {")
-                    self.indent_level += 1
-                    self.emit(f"clearError('{element_id}');")
-                    self.indent_level -= 1
-                    self.emit("}")
-                    
-                    self.emit("")
-                    self.emit("return isValid;")
-                    self.indent_level -= 1
-                    self.emit("}")
-                    self.emit("")
+        for element_id, field_name, _ in bound_fields:
+            self.emit(f"function validate{field_name.title()}(element) {{")
+            self.indent_level += 1
+            self.emit("let isValid = true;")
+            self.emit("")
+            
+            # Find validation rules for this element
+            # This would be expanded to include specific validation logic
+            self.emit("// Add validation logic here")
+            self.emit("if (element.hasAttribute('required') && !element.value.trim()) {")
+            self.indent_level += 1
+            self.emit(f"showError('{element_id}', 'This field is required');")
+            self.emit("isValid = false;")
+            self.indent_level -= 1
+            self.emit("} else {")
+            self.indent_level += 1
+            self.emit(f"clearError('{element_id}');")
+            self.indent_level -= 1
+            self.emit("}")
+            
+            self.emit("")
+            self.emit("return isValid;")
+            self.indent_level -= 1
+            self.emit("}")
+            self.emit("")
         
         self.emit("async function handleFormSubmit(actionName, formId) {")
         self.indent_level += 1
@@ -1504,38 +1419,8 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         self.emit("")
         
         # Generate form data collection based on form elements
-        for element_id, binding_target in self.bindings.items():
-            if '.' in binding_target:
-                model_name, field_name = binding_target.split('.', 1)
-                if model_name in self.data_models:
-                    data_def = self.data_models[model_name]
-                    field = next((f for f in data_def.fields if f.name == field_name), None)
-                    
-                    if field:
-                        safe_element_var = element_id.replace('-', '_')
-                        self.emit(f"const {safe_element_var}Element = document.getElementById('{element_id}');")
-                        self.emit(f"if ({safe_element_var}Element) {{")
-                        self.indent_level += 1
-                        
-                        # Generate data collection based on field type
-                        if field.type.lower() == 'boolean':
-                            self.emit(f"formData.{field_name} = {safe_element_var}Element.checked;")
-                        elif field.type.lower() in ['number', 'int']:
-                            self.emit(f"formData.{field_name} = parseInt({safe_element_var}Element.value) || 0;")
-                        else:
-                            self.emit(f"formData.{field_name} = {safe_element_var}Element.value || '';")
-                        
-                        # Generate validation for this field
-                        self.emit(f"// Validate {field_name}")
-                        self.emit(f"if (!validate{field_name.title()}({safe_element_var}Element)) {{")
-                        self.indent_level += 1
-                        self.emit("isValid = false;")
-                        self.indent_level -= 1
-                        self.emit("}")
-                        
-                        self.indent_level -= 1
-                        self.emit("}")
-                        self.emit("")
+        self._emit_lines(self._field_collection_lines(bound_fields, ".value || '';",
+                                                      separate=True, validate=True))
         
         self.emit("if (!isValid) {")
         self.indent_level += 1
@@ -1583,6 +1468,68 @@ class HTMLCodeGenerator(BaseCodeGenerator):
         self.indent_level -= 1
         self.emit("}")
     
+    def _validation_rule_lines(self) -> Iterator[str]:
+        """Yield the basic validation rule entries for every bound component.
+        
+        Lines are indented relative to the validationRules object body.
+        """
+        for component_id in self.bindings:
+            yield f"'{component_id}': ["
+            yield "  { type: 'required', message: 'This field is required' },"
+            if 'email' in component_id.lower():
+                yield "  { type: 'email', message: 'Please enter a valid email' }"
+            yield "],"
+    
+    def _bound_model_fields(self) -> Tuple[Tuple[str, str, Any], ...]:
+        """Resolve the bindings on data models, in binding order.
+        
+        Each entry is (element_id, field_name, field), where field is None if
+        the model has no field of that name.
+        """
+        bound_fields = []
+        for element_id, binding_target in self.bindings.items():
+            if '.' in binding_target:
+                model_name, field_name = binding_target.split('.', 1)
+                data_def = self.data_models.get(model_name)
+                if data_def is not None:
+                    field = next((f for f in data_def.fields if f.name == field_name), None)
+                    bound_fields.append((element_id, field_name, field))
+        return tuple(bound_fields)
+    
+    def _field_collection_lines(self, bound_fields: Tuple[Tuple[str, str, Any], ...],
+                                text_value: str, separate: bool,
+                                validate: bool) -> Iterator[str]:
+        """Yield the JavaScript that reads each bound data model field into formData.
+        
+        Lines are indented relative to the enclosing function body. text_value
+        is the member access used for non-boolean, non-numeric fields, separate
+        adds a blank line after each field, and validate calls the field's
+        validate function after reading it.
+        """
+        for element_id, field_name, field in bound_fields:
+            if field:
+                safe_element_var = element_id.replace('-', '_')
+                yield f"const {safe_element_var}Element = document.getElementById('{element_id}');"
+                yield f"if ({safe_element_var}Element) {{"
+                
+                # Generate data collection based on field type
+                if field.type.lower() == 'boolean':
+                    yield f"  formData.{field_name} = {safe_element_var}Element.checked;"
+                elif field.type.lower() in ['number', 'int']:
+                    yield f"  formData.{field_name} = parseInt({safe_element_var}Element.value) || 0;"
+                else:
+                    yield f"  formData.{field_name} = {safe_element_var}Element{text_value}"
+                
+                # Generate validation for this field
+                if validate:
+                    yield f"  // Validate {field_name}"
+                    yield f"  if (!validate{field_name.title()}({safe_element_var}Element)) {{"
+                    yield "    isValid = false;"
+                    yield "  }"
+                yield "}"
+                if separate:
+                    yield ""
+    
     def generate_action_js(self, name: str, action: ActionDefinitionWithParams):
         """Generate JavaScript function for action."""
         params = [param.name for param in action.parameters]
@@ -1742,11 +1689,7 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     
     def escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
-        return (text.replace('&', '&amp;')
-                   .replace('<', '&lt;')
-                   .replace('>', '&gt;')
-                   .replace('"', '&quot;')
-                   .replace("'", '&#x27;'))
+        return text.translate(_HTML_ESCAPES)
     
     def escape_js_string(self, text: str) -> str:
         """Escape JavaScript string."""
@@ -1759,8 +1702,9 @@ class HTMLCodeGenerator(BaseCodeGenerator):
     def get_css_classes(self, component: ASTNode, default_classes: List[str] = None) -> str:
         """Get CSS class attribute for a component."""
         classes = default_classes if default_classes else []
-        if hasattr(component, 'css_classes') and component.css_classes:
-            classes.extend(component.css_classes)
+        css_classes = getattr(component, 'css_classes', None)
+        if css_classes:
+            classes.extend(css_classes)
         return " ".join(classes) if classes else ""
     
     def emit_statement(self, stmt: ASTNode):
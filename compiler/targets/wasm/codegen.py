@@ -45,7 +45,7 @@ class WATCodeGenerator(BaseCodeGenerator):
         
     def generate(self, ast: Program) -> str:
         """Generate WAT code from AST."""
-        self.output = []
+        self.clear_output()
         self.string_constants = {}
         self.next_string_index = 0
         
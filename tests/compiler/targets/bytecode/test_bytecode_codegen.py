@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Unit tests for the bytecode code generator."""
+
+import unittest
+import json
+import sys
+from pathlib import Path
+
+# Add compiler to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "compiler"))
+
+from compiler.parser import parse
+from compiler.targets.bytecode.codegen import BytecodeGenerator
+from compiler.ast import *
+
+
+class TestBytecodeGenerator(unittest.TestCase):
+    """Test cases for the bytecode code generator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.generator = BytecodeGenerator()
+
+    def instructions_for(self, program):
+        """Generate bytecode for a program and return its instruction list."""
+        return json.loads(self.generator.generate(program))['instructions']
+
+    def test_display_string(self):
+        """Test string literals are pushed inline."""
+        program = Program(statements=[
+            DisplayStatement(expression=Literal(value="Hello", type="string"))
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"Push": {"String": "Hello"}},
+            "Display",
+            "Halt",
+        ])
+
+    def test_if_statement(self):
+        """Test snake_case visitors are dispatched for CamelCase node classes."""
+        program = Program(statements=[
+            IfStatement(
+                condition=Identifier(name="ok"),
+                then_body=[DisplayStatement(expression=Literal(value=1, type="number"))],
+            )
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"LoadVar": "ok"},
+            {"JumpIfFalse": 5},
+            {"Push": {"Number": 1.0}},
+            "Display",
+            {"Jump": 5},
+            "Halt",
+        ])
+
+    def test_if_else_statement(self):
+        """Test the else branch and the end of an if/else get distinct jump targets."""
+        program = Program(statements=[
+            IfStatement(
+                condition=Identifier(name="ok"),
+                then_body=[DisplayStatement(expression=Literal(value="yes", type="string"))],
+                else_body=[DisplayStatement(expression=Literal(value="no", type="string"))],
+            ),
+            DisplayStatement(expression=Literal(value="done", type="string")),
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"LoadVar": "ok"},
+            {"JumpIfFalse": 5},
+            {"Push": {"String": "yes"}},
+            "Display",
+            {"Jump": 7},
+            {"Push": {"String": "no"}},
+            "Display",
+            {"Push": {"String": "done"}},
+            "Display",
+            "Halt",
+        ])
+
+    def test_while_loop(self):
+        """Test a while loop jumps back to its condition and exits past its body."""
+        program = Program(statements=[
+            WhileLoop(
+                condition=Identifier(name="running"),
+                body=[DisplayStatement(expression=Identifier(name="count"))],
+            )
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"LoadVar": "running"},
+            {"JumpIfFalse": 5},
+            {"LoadVar": "count"},
+            "Display",
+            {"Jump": 0},
+            "Halt",
+        ])
+
+    def test_if_statement_folded_condition(self):
+        """Test a condition folded at compile time emits only the branch that runs."""
+        program = Program(statements=[
+            IfStatement(
+                condition=BinaryOp(
+                    left=Literal(value=1, type="number"),
+                    operator=">",
+                    right=Literal(value=2, type="number"),
+                ),
+                then_body=[DisplayStatement(expression=Literal(value="yes", type="string"))],
+                else_body=[DisplayStatement(expression=Literal(value="no", type="string"))],
+            )
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"Push": {"String": "no"}},
+            "Display",
+            "Halt",
+        ])
+
+    def test_if_statement_non_boolean_condition(self):
+        """Test a literal condition that is not a boolean is left to the VM."""
+        program = Program(statements=[
+            IfStatement(
+                condition=Literal(value=1, type="number"),
+                then_body=[DisplayStatement(expression=Literal(value="yes", type="string"))],
+            )
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"Push": {"Number": 1.0}},
+            {"JumpIfFalse": 5},
+            {"Push": {"String": "yes"}},
+            "Display",
+            {"Jump": 5},
+            "Halt",
+        ])
+
+    def test_while_loop_false_condition(self):
+        """Test a loop that can never run is left out."""
+        program = Program(statements=[
+            WhileLoop(
+                condition=Literal(value=False, type="boolean"),
+                body=[DisplayStatement(expression=Identifier(name="count"))],
+            )
+        ])
+
+        self.assertEqual(self.instructions_for(program), ["Halt"])
+
+    def test_task_action(self):
+        """Test DefineTask keeps its name and parameters and ends at its last body instruction."""
+        program = Program(statements=[
+            TaskAction(
+                name="greet",
+                parameters=[ActionParameter(name="who", type="text")],
+                body=[DisplayStatement(expression=Identifier(name="who"))],
+            ),
+            DisplayStatement(expression=Literal(value="hi", type="string")),
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"DefineTask": ["greet", ["who"], 2]},
+            {"LoadVar": "who"},
+            "Display",
+            {"Push": {"String": "hi"}},
+            "Display",
+            "Halt",
+        ])
+
+    def test_constant_array_literal(self):
+        """Test an array of literals is pushed as one array value."""
+        program = parse("set xs to [1, 2, 3]")
+
+        self.assertEqual(self.instructions_for(program), [
+            {"Push": {"Array": [{"Number": 1.0}, {"Number": 2.0}, {"Number": 3.0}]}},
+            {"StoreVar": "xs"},
+            "Halt",
+        ])
+
+    def test_array_literal_with_variables(self):
+        """Test arrays with non-literal elements are built with CreateArray."""
+        program = Program(statements=[
+            Assignment(variable="xs", value=ArrayLiteral(elements=[
+                Literal(value="a", type="string"),
+                Identifier(name="y"),
+            ]))
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"Push": {"String": "a"}},
+            {"LoadVar": "y"},
+            {"CreateArray": 2},
+            {"StoreVar": "xs"},
+            "Halt",
+        ])
+
+    def test_data_instance(self):
+        """Test data instances set literal and computed fields in order."""
+        program = Program(statements=[
+            Assignment(variable="user", value=DataInstance(data_type="User", field_values=[
+                FieldAssignment(field_name="name", value=Literal(value="Ada", type="string")),
+                FieldAssignment(field_name="age", value=Identifier(name="age")),
+                FieldAssignment(field_name="active", value=Literal(value=True, type="boolean")),
+            ]))
+        ])
+
+        self.assertEqual(self.instructions_for(program), [
+            {"CreateObject": "User"},
+            "Dup",
+            {"Push": {"String": "Ada"}},
+            {"SetField": "name"},
+            "Dup",
+            {"LoadVar": "age"},
+            {"SetField": "age"},
+            "Dup",
+            {"Push": {"Boolean": True}},
+            {"SetField": "active"},
+            {"StoreVar": "user"},
+            "Halt",
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()